@@ -1,12 +1,7 @@
 """Multi-LLM client abstraction."""
 
-import sys
-import os
 from typing import Optional
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from config import config
 from .base import BaseLLMClient
 
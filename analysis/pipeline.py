@@ -21,6 +21,9 @@ from core.storage.repositories import AnalysisRepository, ComparisonRepository,
 from config import config
 
 
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
 class AnalysisError(Exception):
     pass
 
@@ -459,7 +462,7 @@ class AnalysisPipeline:
             return json.loads(text)
         except json.JSONDecodeError:
             # Try to find JSON object in the text
-            match = re.search(r'\{.*\}', text, re.DOTALL)
+            match = _JSON_OBJECT_RE.search(text)
             if match:
                 try:
                     return json.loads(match.group())
@@ -0,0 +1,24 @@
+"""Shared FastAPI dependencies.
+
+Services are built lazily on first use and shared by every router, so
+importing the API does not construct them and the BSE scrip list is only
+loaded once per process.
+"""
+
+from functools import lru_cache
+
+from config import config
+from core.services import EarningsService
+from core.storage.bse_scrip import BseScripStore
+
+
+@lru_cache(maxsize=1)
+def get_earnings_service() -> EarningsService:
+    """Return the process-wide EarningsService."""
+    return EarningsService()
+
+
+@lru_cache(maxsize=1)
+def get_bse_scrip_store() -> BseScripStore:
+    """Return the process-wide BSE scrip list store."""
+    return BseScripStore(config.bse_scrip_path, cache_ttl=config.suggest_cache_ttl)
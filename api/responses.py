@@ -0,0 +1,18 @@
+"""Response classes shared by API routes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Hot listing endpoints return this directly with plain dicts, which skips
+    FastAPI's jsonable_encoder walk and the stdlib json encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,18 +1,18 @@
 """Company search API endpoints."""
 
+import asyncio
 from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
 
-from config import config
 from core.services import EarningsService
 from core.storage.bse_scrip import BseScripStore
 from sources.base import Region
+from ..dependencies import get_bse_scrip_store, get_earnings_service
+from ..responses import OrjsonResponse
 
 
 router = APIRouter(prefix="/api/companies", tags=["companies"])
-service = EarningsService()
-BSE_SCRIP_STORE = BseScripStore(config.bse_scrip_path)
 
 
 class CompanySearchResult(BaseModel):
@@ -42,7 +42,8 @@ class CompanySuggestion(BaseModel):
 @router.get("/search", response_model=List[CompanySearchResult])
 async def search_companies(
     q: str = Query(..., min_length=1, description="Company name to search"),
-    region: Optional[str] = Query(None, description="Region to search in (india, us, japan, korea, china)")
+    region: Optional[str] = Query(None, description="Region to search in (india, us, japan, korea, china)"),
+    service: EarningsService = Depends(get_earnings_service)
 ):
     """
     Search for companies by name.
@@ -61,18 +62,27 @@ async def search_companies(
 
 
 @router.get("/regions", response_model=List[RegionInfo])
-async def list_regions():
+async def list_regions(service: EarningsService = Depends(get_earnings_service)):
     """
     List all available regions with their sources.
     """
     return service.get_available_regions()
 
 
-@router.get("/suggest", response_model=List[CompanySuggestion])
+# Autocomplete is hit on every keystroke: plain dicts are returned as an
+# orjson response, bypassing validation and jsonable_encoder. CompanySuggestion
+# is kept only for the OpenAPI schema.
+@router.get(
+    "/suggest",
+    response_class=OrjsonResponse,
+    responses={200: {"model": List[CompanySuggestion]}}
+)
 async def suggest_companies(
     q: str = Query(..., min_length=1, description="Company name to suggest"),
     region: Optional[str] = Query("india", description="Region to search in (india, us, japan, korea, china)"),
-    limit: int = Query(20, ge=1, le=50, description="Maximum suggestions to return")
+    limit: int = Query(20, ge=1, le=50, description="Maximum suggestions to return"),
+    service: EarningsService = Depends(get_earnings_service),
+    bse_scrip_store: BseScripStore = Depends(get_bse_scrip_store)
 ):
     """
     Suggest companies for autocomplete.
@@ -86,18 +96,19 @@ async def suggest_companies(
         raise HTTPException(status_code=400, detail=f"Invalid region: {region}")
 
     if region_enum == Region.INDIA:
-        return BSE_SCRIP_STORE.suggest(q, limit=limit)
+        return OrjsonResponse(await bse_scrip_store.suggest_async(q, limit=limit))
 
-    results = service.search_company(q, region=region_enum)
-    suggestions: List[CompanySuggestion] = []
+    # Source searches are blocking HTTP calls
+    results = await asyncio.to_thread(service.search_company, q, region=region_enum)
+    suggestions: List[dict] = []
     for result in results[:limit]:
         name = result.get("name") or ""
         if not name:
             continue
-        suggestions.append(CompanySuggestion(
-            name=name,
-            symbol=result.get("symbol"),
-            isin=result.get("isin"),
-            label=name
-        ))
-    return suggestions
+        suggestions.append({
+            "name": name,
+            "symbol": result.get("symbol"),
+            "isin": result.get("isin"),
+            "label": name,
+        })
+    return OrjsonResponse(suggestions)
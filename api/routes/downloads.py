@@ -6,8 +6,8 @@ import zipfile
 import asyncio
 import logging
 import aiohttp
-from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException
+from typing import AsyncIterator, List, Optional
+from fastapi import APIRouter, Depends, Query, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
@@ -15,10 +15,11 @@ from core.services import EarningsService
 from core.models import EarningsCall
 from sources.base import Region
 from config import config
+from ..dependencies import get_earnings_service
+from ..responses import OrjsonResponse
 
 
 router = APIRouter(prefix="/api", tags=["downloads"])
-service = EarningsService()
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +44,24 @@ class DownloadRequest(BaseModel):
     include_press_releases: bool = True
 
 
-@router.get("/documents", response_model=List[DocumentResponse])
+async def _collect_documents(
+    service: EarningsService,
+    companies: List[str],
+    **kwargs
+) -> List[EarningsCall]:
+    """Fetch documents for several companies concurrently."""
+    results = await asyncio.gather(*(
+        service.get_earnings_documents_async(company, **kwargs)
+        for company in companies
+    ))
+    return [doc for documents in results for doc in documents]
+
+
+@router.get(
+    "/documents",
+    response_class=OrjsonResponse,
+    responses={200: {"model": List[DocumentResponse]}}
+)
 async def get_documents(
     company: str = Query(..., description="Company name(s), comma-separated for multiple"),
     region: Optional[str] = Query("india", description="Region (india, us, japan, korea, china)"),
@@ -51,7 +69,8 @@ async def get_documents(
     types: Optional[str] = Query(
         "transcript,presentation,press_release",
         description="Document types (comma-separated)"
-    )
+    ),
+    service: EarningsService = Depends(get_earnings_service)
 ):
     """
     Get available earnings documents for one or more companies.
@@ -68,50 +87,110 @@ async def get_documents(
     # Support multiple companies (comma-separated)
     companies = [c.strip() for c in company.split(",") if c.strip()]
 
-    all_documents = []
-    for comp in companies:
-        documents = service.get_earnings_documents(
-            comp,
-            region=region_enum,
-            count=count,
-            include_transcripts="transcript" in doc_types,
-            include_presentations="presentation" in doc_types,
-            include_press_releases="press_release" in doc_types
-        )
-        all_documents.extend(documents)
-
-    return [
-        DocumentResponse(
-            company=doc.company,
-            quarter=doc.quarter,
-            year=doc.year,
-            doc_type=doc.doc_type,
-            url=doc.url,
-            source=doc.source,
-            filename=doc.get_filename()
-        )
+    all_documents = await _collect_documents(
+        service,
+        companies,
+        region=region_enum,
+        count=count,
+        include_transcripts="transcript" in doc_types,
+        include_presentations="presentation" in doc_types,
+        include_press_releases="press_release" in doc_types
+    )
+
+    return OrjsonResponse([
+        {
+            "company": doc.company,
+            "quarter": doc.quarter,
+            "year": doc.year,
+            "doc_type": doc.doc_type,
+            "url": doc.url,
+            "source": doc.source,
+            "filename": doc.filename,
+        }
         for doc in all_documents
-    ]
+    ])
 
 
-async def fetch_file(session: aiohttp.ClientSession, url: str, filename: str) -> tuple:
+async def fetch_file(
+    session: aiohttp.ClientSession,
+    url: str,
+    filename: str,
+    semaphore: asyncio.Semaphore
+) -> tuple:
     """Fetch a single file and return (filename, content) or (filename, None) on error."""
-    try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-            if resp.status == 200:
-                content = await resp.read()
-                return (filename, content)
-    except Exception as e:
-        logger.warning("Error fetching %s: %s", url, e)
+    async with semaphore:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                if resp.status == 200:
+                    content = await resp.read()
+                    return (filename, content)
+        except Exception as e:
+            logger.warning("Error fetching %s: %s", url, e)
     return (filename, None)
 
 
+class _ZipChunkSink(io.RawIOBase):
+    """Write-only sink that collects ZIP bytes until the response drains them."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _stream_zip(documents: List[EarningsCall]) -> AsyncIterator[bytes]:
+    """
+    Yield a ZIP archive of the documents as they finish downloading.
+
+    Files are fetched concurrently and each one is written to the archive as
+    soon as it arrives, so the client starts receiving data after the first
+    download instead of the last. Entries are stored uncompressed since the
+    documents are mostly already-compressed PDFs.
+    """
+    sink = _ZipChunkSink()
+    semaphore = asyncio.Semaphore(config.max_concurrent_downloads)
+    async with aiohttp.ClientSession(
+        headers={"User-Agent": config.user_agent}
+    ) as session:
+        tasks = [
+            asyncio.create_task(fetch_file(session, doc.url, doc.filename, semaphore))
+            for doc in documents
+        ]
+        try:
+            with zipfile.ZipFile(sink, 'w', zipfile.ZIP_STORED) as zf:
+                for next_done in asyncio.as_completed(tasks):
+                    filename, content = await next_done
+                    if content:
+                        zf.writestr(filename, content)
+                        yield sink.drain()
+            # Central directory is written when the archive closes
+            yield sink.drain()
+        finally:
+            # Client went away mid-stream: stop outstanding fetches
+            for task in tasks:
+                task.cancel()
+
+
 @router.post("/downloads/zip")
-async def download_as_zip(request: DownloadRequest):
+async def download_as_zip(
+    request: DownloadRequest,
+    service: EarningsService = Depends(get_earnings_service)
+):
     """
     Download all earnings documents as a ZIP file.
 
-    Fetches all documents and returns them as a downloadable ZIP.
+    Streams a ZIP that grows as each document is fetched.
     Supports multiple companies (comma-separated).
     """
     region_enum = None
@@ -124,40 +203,19 @@ async def download_as_zip(request: DownloadRequest):
     # Support multiple companies (comma-separated)
     companies = [c.strip() for c in request.company.split(",") if c.strip()]
 
-    all_documents = []
-    for comp in companies:
-        documents = service.get_earnings_documents(
-            comp,
-            region=region_enum,
-            count=request.count,
-            include_transcripts=request.include_transcripts,
-            include_presentations=request.include_presentations,
-            include_press_releases=request.include_press_releases
-        )
-        all_documents.extend(documents)
+    all_documents = await _collect_documents(
+        service,
+        companies,
+        region=region_enum,
+        count=request.count,
+        include_transcripts=request.include_transcripts,
+        include_presentations=request.include_presentations,
+        include_press_releases=request.include_press_releases
+    )
 
     if not all_documents:
         raise HTTPException(status_code=404, detail="No documents found for the specified companies")
 
-    # Fetch all files concurrently
-    async with aiohttp.ClientSession(
-        headers={"User-Agent": config.user_agent}
-    ) as session:
-        tasks = [
-            fetch_file(session, doc.url, doc.get_filename())
-            for doc in all_documents
-        ]
-        results = await asyncio.gather(*tasks)
-
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for filename, content in results:
-            if content:
-                zf.writestr(filename, content)
-
-    zip_buffer.seek(0)
-
     # Generate safe filename
     if len(companies) == 1:
         safe_name = "".join(c if c.isalnum() or c in " -_" else "_" for c in companies[0])
@@ -167,7 +225,7 @@ async def download_as_zip(request: DownloadRequest):
     zip_filename = f"{safe_name}_earnings.zip"
 
     return StreamingResponse(
-        zip_buffer,
+        _stream_zip(all_documents),
         media_type="application/zip",
         headers={"Content-Disposition": f"attachment; filename={zip_filename}"}
     )
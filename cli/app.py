@@ -165,12 +165,11 @@ def search_and_download(
 
     # Download
     console.print()
-    results = []
-    for company in set(c.company for c in all_calls):
-        company_calls = [c for c in all_calls if c.company == company]
-        output_dir = config.get_output_path(company)
+    # One session for every company so same-host downloads share connections
+    groups = downloader.group_by_output_dir(all_calls)
+    for output_dir in groups:
         console.print(f"[bold]Downloading to: {output_dir}[/bold]")
-        results.extend(downloader.download_sync(company_calls, output_dir))
+    results = downloader.download_grouped_sync(groups)
 
     # Summary
     success_count = sum(1 for _, success, _ in results if success)
@@ -20,6 +20,18 @@ class Config:
     request_timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    max_concurrent_downloads: int = 8  # Parallel file fetches per download batch
+
+    # In-process response caches (seconds)
+    documents_cache_ttl: int = 300  # Document listings change per quarter
+    suggest_cache_ttl: int = 60     # BSE scrip list changes at most daily
+
+    # On-disk HTTP cache for scraped pages and reference data
+    http_cache_dir: str = field(
+        default_factory=lambda: os.environ.get("HTTP_CACHE_DIR", "./data/cache")
+    )
+    http_cache_ttl: int = 3600  # seconds
+    ticker_cache_ttl: int = 86400  # SEC ticker list is republished daily
 
     # User agent for requests
     user_agent: str = (
@@ -3,17 +3,21 @@
 from .models import (
     EarningsCall,
     normalize_company_name,
+    normalize_company_key,
     deduplicate_calls,
     fuzzy_match_company,
     find_best_company_match,
+    batch_best_matches,
 )
 from .services import EarningsService
 
 __all__ = [
     "EarningsCall",
     "normalize_company_name",
+    "normalize_company_key",
     "deduplicate_calls",
     "fuzzy_match_company",
     "find_best_company_match",
+    "batch_best_matches",
     "EarningsService",
 ]
@@ -1,9 +1,14 @@
 """Data models for earnings downloader."""
 
+import os
 import re
+import sys
+from functools import cached_property, lru_cache
 from typing import Optional, List, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from urllib.parse import urlparse
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 from rapidfuzz import fuzz, process
 
 
@@ -129,6 +134,36 @@ class IndustryAnalysis(BaseModel):
 # --- Download Models ---
 
 
+# URL path suffix -> saved file extension; anything else is saved as .pdf
+_EXTENSION_MAP = {
+    '.pdf': '.pdf',
+    '.ppt': '.pptx',
+    '.pptx': '.pptx',
+    '.mp3': '.mp3',
+    '.wav': '.mp3',
+}
+
+
+_FILENAME_CHAR_RE = re.compile(r'[\w\s-]')
+
+
+class _FilenameCharTable(dict):
+    """
+    str.translate table that drops characters outside _FILENAME_CHAR_RE.
+
+    Filled on first sight of each code point, so it only ever holds the few
+    characters that actually appear in company names.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = codepoint if _FILENAME_CHAR_RE.match(chr(codepoint)) else None
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_CHARS = _FilenameCharTable()
+
+
 class EarningsCall(BaseModel):
     """Represents an earnings call document."""
 
@@ -140,46 +175,60 @@ class EarningsCall(BaseModel):
     source: str = Field(..., description="Source name: screener, company_ir, edgar, etc.")
     date: Optional[datetime] = Field(None, description="Document date if available")
 
-    class Config:
-        frozen = True  # Make hashable for deduplication
+    model_config = ConfigDict(frozen=True)  # Make hashable for deduplication
 
-    def get_filename(self) -> str:
-        """Generate filename for this document."""
+    @cached_property
+    def filename(self) -> str:
+        """Filename for this document, built once per instance."""
         ext = self._get_extension()
-        safe_company = re.sub(r'[^\w\s-]', '', self.company)
+        safe_company = self.company.translate(_FILENAME_CHARS)
         safe_company = safe_company.strip().replace(' ', '_')[:50]
         return f"{safe_company}_{self.quarter}{self.year}_{self.doc_type}{ext}"
 
+    def get_filename(self) -> str:
+        """Generate filename for this document."""
+        return self.filename
+
     def _get_extension(self) -> str:
-        """Determine file extension from URL or doc type."""
-        url_lower = self.url.lower()
-        if '.pdf' in url_lower:
-            return '.pdf'
-        elif '.ppt' in url_lower or '.pptx' in url_lower:
-            return '.pptx'
-        elif '.mp3' in url_lower or '.wav' in url_lower:
-            return '.mp3'
-        elif self.doc_type == 'presentation':
-            return '.pdf'
-        return '.pdf'
+        """Determine file extension from the URL path (PDF by default)."""
+        suffix = os.path.splitext(urlparse(self.url).path)[1].lower()
+        return _EXTENSION_MAP.get(suffix, '.pdf')
+
+
+# Legal-form suffixes dropped by normalize_company_name
+_COMPANY_SUFFIX_RE = re.compile(
+    r'\s+(?:Ltd\.?|Limited|Inc\.?|Corp|Corporation|Co\.?|Company|PLC|NV|SA|AG|SE'
+    r'|Holdings|Group|International|Intl)$',
+    re.IGNORECASE,
+)
 
 
+# Sized to hold a full exchange scrip list (~5-10k names) so reloading it,
+# and the queries run against it, hit the cache instead of re-normalizing
+@lru_cache(maxsize=65536)
 def normalize_company_name(name: str) -> str:
     """Normalize company name for searching."""
-    suffixes = [
-        ' Ltd', ' Limited', ' Ltd.', ' Inc', ' Inc.', ' Corp', ' Corporation',
-        ' Co.', ' Co', ' Company', ' PLC', ' plc', ' NV', ' SA', ' AG', ' SE',
-        ' Holdings', ' Group', ' International', ' Intl',
-    ]
     normalized = name.strip()
-    for suffix in suffixes:
-        if normalized.lower().endswith(suffix.lower()):
-            normalized = normalized[:-len(suffix)]
+    # Strip trailing legal-form suffixes ("Holdings Ltd." -> "")
+    count = 1
+    while count:
+        normalized, count = _COMPANY_SUFFIX_RE.subn('', normalized)
     # Remove extra whitespace
     normalized = ' '.join(normalized.split())
     return normalized.strip()
 
 
+@lru_cache(maxsize=65536)
+def normalize_company_key(name: str) -> str:
+    """
+    Lowercased normalize_company_name, for matching and dict keys.
+
+    Results are interned, so equal keys are usually the same object and
+    compare by identity.
+    """
+    return sys.intern(normalize_company_name(name).lower())
+
+
 def fuzzy_match_company(
     query: str,
     candidates: List[str],
@@ -199,18 +248,19 @@ def fuzzy_match_company(
     if not candidates:
         return []
 
-    normalized_query = normalize_company_name(query).lower()
+    normalized_query = normalize_company_key(query)
 
     # Use rapidfuzz for fuzzy matching
     results = process.extract(
         normalized_query,
         candidates,
         scorer=fuzz.WRatio,  # Weighted ratio handles partial matches well
-        limit=10
+        processor=None,  # Candidates are compared as given, never re-processed
+        limit=10,
+        score_cutoff=threshold  # Lets rapidfuzz abandon hopeless candidates early
     )
 
-    # Filter by threshold and return
-    return [(name, score) for name, score, _ in results if score >= threshold]
+    return [(name, score) for name, score, _ in results]
 
 
 def find_best_company_match(
@@ -237,9 +287,53 @@ def find_best_company_match(
     return None
 
 
+def batch_best_matches(
+    queries: List[str],
+    candidates: List[str],
+    threshold: int = 60
+) -> List[Optional[str]]:
+    """
+    Find the best matching candidate for many queries at once.
+
+    Scores the full query x candidate matrix in a single multi-threaded
+    rapidfuzz call instead of one process.extract per query. Scores are
+    rounded to whole points (uint8) to halve the matrix size.
+
+    Args:
+        queries: Search queries
+        candidates: List of company names to match against
+        threshold: Minimum match score (0-100)
+
+    Returns:
+        Best matching candidate (or None) for each query, in query order
+    """
+    if not queries or not candidates:
+        return [None] * len(queries)
+
+    normalized_queries = [normalize_company_key(q) for q in queries]
+    scores = process.cdist(
+        normalized_queries,
+        candidates,
+        scorer=fuzz.WRatio,
+        processor=None,
+        score_cutoff=threshold,
+        dtype=np.uint8,
+        workers=-1  # Use all cores
+    )
+    best = scores.argmax(axis=1)
+
+    return [
+        candidates[col] if scores[row, col] >= threshold else None
+        for row, col in enumerate(best)
+    ]
+
+
+_QUARTER_YEAR_RE = re.compile(r'Q([1-4])\s*(?:FY)?(\d{2,4})', re.IGNORECASE)
+
+
 def parse_quarter_year(text: str) -> tuple[Optional[str], Optional[str]]:
     """Extract quarter and year from text like 'Q3FY26' or 'Q3 2025'."""
-    match = re.search(r'Q([1-4])\s*(?:FY)?(\d{2,4})', text, re.IGNORECASE)
+    match = _QUARTER_YEAR_RE.search(text)
     if match:
         quarter = f"Q{match.group(1)}"
         year_str = match.group(2)
@@ -251,48 +345,45 @@ def parse_quarter_year(text: str) -> tuple[Optional[str], Optional[str]]:
     return None, None
 
 
+# Priority: lower number = higher priority (preferred)
+# 1. NSE/BSE official filings
+# 2. Screener/Tijori (aggregators that link to exchange filings)
+# 3. Company IR website (factsheets, additional materials)
+_SOURCE_PRIORITY = {
+    "bse": 0,
+    "nse": 0,
+    "screener": 1,
+    "trendlyne": 1,
+    "tijori": 1,
+    "company_ir": 2,
+    "edgar": 0,  # Official SEC filings (US)
+    "tdnet": 0,  # Official Japan filings
+    "dart": 0,   # Official Korea filings
+    "cninfo": 0, # Official China filings
+}
+
+
 def deduplicate_calls(calls: list[EarningsCall]) -> list[EarningsCall]:
     """Remove duplicate earnings calls, preferring certain sources."""
 
-    # Priority: lower number = higher priority (preferred)
-    # 1. NSE/BSE official filings
-    # 2. Screener/Tijori (aggregators that link to exchange filings)
-    # 3. Company IR website (factsheets, additional materials)
-    source_priority = {
-        "bse": 0,
-        "nse": 0,
-        "screener": 1,
-        "trendlyne": 1,
-        "tijori": 1,
-        "company_ir": 2,
-        "edgar": 0,  # Official SEC filings (US)
-        "tdnet": 0,  # Official Japan filings
-        "dart": 0,   # Official Korea filings
-        "cninfo": 0, # Official China filings
-    }
-
     # First pass: deduplicate by URL (exact same document)
-    seen_urls = {}
+    # url_key -> (priority, call); priority is looked up once per call
+    seen_urls: dict[str, tuple[int, EarningsCall]] = {}
     for call in calls:
+        priority = _SOURCE_PRIORITY.get(call.source, 99)
         url_key = call.url.lower().rstrip('/')
-        if url_key not in seen_urls:
-            seen_urls[url_key] = call
-        else:
-            existing = seen_urls[url_key]
-            if source_priority.get(call.source, 99) < source_priority.get(existing.source, 99):
-                seen_urls[url_key] = call
-
-    # Second pass: deduplicate by (company, quarter, year, doc_type)
-    seen = {}  # (normalized_company, quarter, year, doc_type) -> call
-    for call in seen_urls.values():
-        # Normalize company name for better matching
-        normalized_company = normalize_company_name(call.company).lower()
+        existing = seen_urls.get(url_key)
+        if existing is None or priority < existing[0]:
+            seen_urls[url_key] = (priority, call)
+
+    # Second pass (URL winners only): deduplicate by (company, quarter, year, doc_type)
+    seen: dict[tuple, tuple[int, EarningsCall]] = {}
+    for priority, call in seen_urls.values():
+        # Normalize company name for better matching (cached per company)
+        normalized_company = normalize_company_key(call.company)
         key = (normalized_company, call.quarter, call.year, call.doc_type)
-        if key not in seen:
-            seen[key] = call
-        else:
-            existing = seen[key]
-            if source_priority.get(call.source, 99) < source_priority.get(existing.source, 99):
-                seen[key] = call
+        existing = seen.get(key)
+        if existing is None or priority < existing[0]:
+            seen[key] = (priority, call)
 
-    return list(seen.values())
+    return [call for _, call in seen.values()]
@@ -1,10 +1,14 @@
 """Earnings document service - shared business logic for CLI and API."""
 
+import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from cachetools import TTLCache
+
+from config import config
 from sources import SourceRegistry
-from sources.base import Region
+from sources.base import BaseSource, Region
 from core.models import EarningsCall, deduplicate_calls
 
 
@@ -19,6 +23,10 @@ class EarningsService:
         import sources.korea  # noqa: F401
         import sources.china  # noqa: F401
         self._logger = logging.getLogger(__name__)
+        # (company, region, count, include flags) -> deduplicated documents
+        self._documents_cache: TTLCache = TTLCache(
+            maxsize=1024, ttl=config.documents_cache_ttl
+        )
 
     def search_company(
         self,
@@ -35,13 +43,8 @@ class EarningsService:
         Returns:
             List of company info dicts with name, url, source, region
         """
-        if region:
-            sources = SourceRegistry.get_sources(region)
-        else:
-            sources = SourceRegistry.get_all_sources()
-
         results = []
-        for source in sources:
+        for source in self._get_sources(region):
             result = source.search_company(query)
             if result:
                 results.append(result)
@@ -71,28 +74,109 @@ class EarningsService:
         Returns:
             Deduplicated list of EarningsCall objects
         """
+        cache_key = self._cache_key(
+            company_name, region, count,
+            include_transcripts, include_presentations, include_press_releases
+        )
+        cached = self._documents_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         all_calls: List[EarningsCall] = []
+        for source in self._get_sources(region):
+            all_calls.extend(self._fetch_from_source(
+                source,
+                company_name,
+                count,
+                include_transcripts=include_transcripts,
+                include_presentations=include_presentations,
+                include_press_releases=include_press_releases
+            ))
+
+        # Deduplicate - keeps highest priority source for each document
+        documents = deduplicate_calls(all_calls)
+        return self._remember(cache_key, documents)
+
+    async def get_earnings_documents_async(
+        self,
+        company_name: str,
+        region: Optional[Region] = None,
+        count: int = 5,
+        include_transcripts: bool = True,
+        include_presentations: bool = True,
+        include_press_releases: bool = True
+    ) -> List[EarningsCall]:
+        """
+        Async variant of get_earnings_documents that queries sources concurrently.
 
+        Sources use blocking HTTP clients, so each one runs in a worker thread;
+        wall-clock time is that of the slowest source rather than their sum.
+        """
+        cache_key = self._cache_key(
+            company_name, region, count,
+            include_transcripts, include_presentations, include_press_releases
+        )
+        cached = self._documents_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        results = await asyncio.gather(*(
+            asyncio.to_thread(
+                self._fetch_from_source,
+                source,
+                company_name,
+                count,
+                include_transcripts=include_transcripts,
+                include_presentations=include_presentations,
+                include_press_releases=include_press_releases
+            )
+            for source in self._get_sources(region)
+        ))
+
+        # gather preserves source (priority) order, matching the sync path
+        all_calls = [call for calls in results for call in calls]
+        documents = deduplicate_calls(all_calls)
+        return self._remember(cache_key, documents)
+
+    @staticmethod
+    def _cache_key(
+        company_name: str,
+        region: Optional[Region],
+        count: int,
+        include_transcripts: bool,
+        include_presentations: bool,
+        include_press_releases: bool
+    ) -> Tuple:
+        """Documents-cache key shared by the sync and async lookups."""
+        return (
+            company_name, region, count,
+            include_transcripts, include_presentations, include_press_releases
+        )
+
+    def _remember(self, cache_key: Tuple, documents: List[EarningsCall]) -> List[EarningsCall]:
+        """Cache deduplicated documents and return a copy for the caller."""
+        if documents:  # don't pin transient source failures for the full TTL
+            self._documents_cache[cache_key] = documents
+        return list(documents)
+
+    def _get_sources(self, region: Optional[Region]) -> List[BaseSource]:
         if region:
-            sources = SourceRegistry.get_sources(region)
-        else:
-            sources = SourceRegistry.get_all_sources()
-
-        for source in sources:
-            try:
-                calls = source.get_earnings_calls(
-                    company_name,
-                    count,
-                    include_transcripts=include_transcripts,
-                    include_presentations=include_presentations,
-                    include_press_releases=include_press_releases
-                )
-                all_calls.extend(calls)
-            except Exception as e:
-                self._logger.warning("Error from %s: %s", source.source_name, e)
+            return SourceRegistry.get_sources(region)
+        return SourceRegistry.get_all_sources()
 
-        # Deduplicate - keeps highest priority source for each document
-        return deduplicate_calls(all_calls)
+    def _fetch_from_source(
+        self,
+        source: BaseSource,
+        company_name: str,
+        count: int,
+        **kwargs
+    ) -> List[EarningsCall]:
+        """Get documents from one source, logging and swallowing its errors."""
+        try:
+            return source.get_earnings_calls(company_name, count, **kwargs)
+        except Exception as e:
+            self._logger.warning("Error from %s: %s", source.source_name, e)
+            return []
 
     def get_available_regions(self) -> List[dict]:
         """
@@ -1,131 +1,333 @@
 """Load and search BSE scrip list for company suggestions."""
 
+import asyncio
 import csv
+import heapq
 import logging
 import os
-from typing import Dict, List, Optional
+import pickle
+import uuid
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from core.models import normalize_company_name
+from cachetools import TTLCache
+
+from core.models import fuzzy_match_company, normalize_company_key
 
 
 logger = logging.getLogger(__name__)
 
+# Bump when the pickled index layout changes so stale sidecars are ignored
+_INDEX_VERSION = 2
+
+# Sorts after any character a key can contain, closing a prefix range
+_PREFIX_END = "\U0010ffff"
+
+
+def _sorted_keys(pairs: Iterable[Tuple[str, int]]) -> Tuple[List[str], List[int]]:
+    """Split (key, entry_index) pairs, sorted by key, into parallel lists."""
+    ordered = sorted(pairs)
+    return [key for key, _ in ordered], [index for _, index in ordered]
+
+
+def _prefix_range(keys: List[str], prefix: str) -> Tuple[int, int]:
+    """Slice bounds of the keys starting with prefix (keys must be sorted)."""
+    return bisect_left(keys, prefix), bisect_left(keys, prefix + _PREFIX_END)
+
+
+def _build_prefix_keys(entries: List[Dict[str, Any]]) -> Tuple[List[str], List[int], List[str], List[int]]:
+    """Sorted name aliases and symbols, each with the entry index it belongs to."""
+    name_keys, name_key_indices = _sorted_keys(
+        (alias, index)
+        for index, entry in enumerate(entries)
+        for alias in entry["aliases"]
+    )
+    symbol_keys, symbol_key_indices = _sorted_keys(
+        (entry["symbol_norm"], index)
+        for index, entry in enumerate(entries)
+        if entry["symbol_norm"]
+    )
+    return name_keys, name_key_indices, symbol_keys, symbol_key_indices
+
+
+def _block_key(name: str) -> str:
+    """First alphanumeric character of a normalized name ("" if none)."""
+    for char in name:
+        if char.isalnum():
+            return char
+    return ""
+
 
 class BseScripStore:
     """In-memory cache for BSE scrip list."""
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, cache_ttl: float = 60):
         self.path = path
-        self._entries: List[Dict[str, str]] = []
+        # Parsed entries and sorted prefix keys persisted next to the CSV,
+        # keyed by its mtime
+        self._index_path = path + ".idx.pkl"
+        # (normalized_query, limit) -> suggestions; cleared whenever the list reloads
+        self._suggest_cache: TTLCache = TTLCache(maxsize=4096, ttl=cache_ttl)
+        # Entries are stored column-wise; index i across every column is one
+        # scrip, in rank (name_norm) order
+        self._names: List[str] = []
+        self._symbols: List[str] = []
+        self._isins: List[str] = []
+        self._labels: List[str] = []
+        self._fuzzy_candidates: List[str] = []
+        self._fuzzy_blocks: Dict[str, List[str]] = {}
+        # Sorted name aliases / symbols with the entry index of each, for
+        # prefix lookups by binary search
+        self._name_keys: List[str] = []
+        self._name_key_indices: List[int] = []
+        self._symbol_keys: List[str] = []
+        self._symbol_key_indices: List[int] = []
         self._mtime: Optional[float] = None
+        # Single worker: lookups (and the occasional reload) run off the event
+        # loop, one at a time, so the store needs no locking
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bse-scrip")
+
+    def _reset(self) -> None:
+        self._suggest_cache.clear()
+        self._names = []
+        self._symbols = []
+        self._isins = []
+        self._labels = []
+        self._fuzzy_candidates = []
+        self._fuzzy_blocks = {}
+        self._name_keys = []
+        self._name_key_indices = []
+        self._symbol_keys = []
+        self._symbol_key_indices = []
+        self._mtime = None
 
-    def _normalize_row(self, row: Dict[str, str]) -> Dict[str, str]:
-        normalized: Dict[str, str] = {}
-        for key, value in row.items():
-            if key is None:
+    @staticmethod
+    def _column(rows: List[List[str]], header: List[str], name: str) -> List[str]:
+        """Stripped cells of one column ("" for short rows or a missing column)."""
+        try:
+            index = header.index(name)
+        except ValueError:
+            return [""] * len(rows)
+        return list(map(str.strip, [row[index] if index < len(row) else "" for row in rows]))
+
+    def _read_csv(self) -> List[Dict[str, Any]]:
+        """Parse the scrip CSV into entries merged by normalized name, in rank order."""
+        entries: List[Dict[str, Any]] = []
+        by_name: Dict[str, Dict[str, Any]] = {}
+        aliases_by_name: Dict[str, set[str]] = {}
+        with open(self.path, "r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = [column.strip().lower() for column in next(reader, [])]
+            rows = list(reader)
+
+        # Strip/lower whole columns with C-level map() calls instead of
+        # per-cell method calls inside the row loop
+        names = [
+            company_name or alt_name
+            for company_name, alt_name in zip(
+                self._column(rows, header, "company name"),
+                self._column(rows, header, "name"),
+            )
+        ]
+        symbols = self._column(rows, header, "symbol")
+        isins = self._column(rows, header, "isin")
+        raw_norms = list(map(str.lower, names))
+        symbol_norms = list(map(str.lower, symbols))
+
+        for name, symbol, isin, raw_norm, symbol_norm in zip(
+            names, symbols, isins, raw_norms, symbol_norms
+        ):
+            if not name:
                 continue
-            normalized[key.strip().lower()] = (value or "").strip()
-        return normalized
+            name_norm = normalize_company_key(name) or raw_norm
+
+            if name_norm not in by_name:
+                entry = {
+                    "name": name,
+                    "symbol": symbol,
+                    "isin": isin,
+                    "name_norm": name_norm,
+                    "symbol_norm": symbol_norm,
+                }
+                by_name[name_norm] = entry
+                aliases_by_name[name_norm] = {name_norm, raw_norm}
+            else:
+                entry = by_name[name_norm]
+                aliases_by_name[name_norm].add(raw_norm)
+                aliases_by_name[name_norm].add(name_norm)
+
+                # Prefer keeping a symbol/isin if the existing entry lacks it
+                if not entry.get("symbol") and symbol:
+                    entry["symbol"] = symbol
+                    entry["symbol_norm"] = symbol_norm
+                if not entry.get("isin") and isin:
+                    entry["isin"] = isin
+
+        # Build final entries list with aliases for matching
+        for name_norm, entry in by_name.items():
+            entry["aliases"] = tuple(aliases_by_name.get(name_norm, {name_norm}))
+            entries.append(entry)
+
+        entries.sort(key=lambda item: item["name_norm"])
+        return entries
+
+    def _read_index(self, mtime: float) -> Optional[Tuple[List[Dict[str, Any]], Tuple]]:
+        """(entries, prefix keys) from the pickled sidecar, if it was built from
+        this CSV version."""
+        try:
+            with open(self._index_path, "rb") as handle:
+                version, stored_mtime, entries, prefix_keys = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable BSE scrip index %s: %s", self._index_path, exc)
+            return None
+        if version != _INDEX_VERSION or stored_mtime != mtime:
+            return None
+        return entries, prefix_keys
+
+    def _write_index(self, mtime: float, entries: List[Dict[str, Any]], prefix_keys: Tuple) -> None:
+        """Persist parsed entries and prefix keys; a read-only data directory
+        just skips this."""
+        # Unique per writer, so concurrent writers never share a temp file
+        tmp_path = f"{self._index_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as handle:
+                pickle.dump((_INDEX_VERSION, mtime, entries, prefix_keys), handle, protocol=5)
+            os.replace(tmp_path, self._index_path)
+        except OSError as exc:
+            logger.debug("Could not write BSE scrip index %s: %s", self._index_path, exc)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def _load_if_needed(self) -> bool:
         if not os.path.exists(self.path):
-            if self._entries:
+            if self._names:
                 logger.warning("BSE scrip file not found at %s", self.path)
-            self._entries = []
-            self._mtime = None
+            self._reset()
             return False
 
         mtime = os.path.getmtime(self.path)
-        if self._mtime == mtime and self._entries:
+        if self._mtime == mtime and self._names:
             return True
 
-        entries: List[Dict[str, str]] = []
-        by_name: Dict[str, Dict[str, str]] = {}
-        aliases_by_name: Dict[str, set[str]] = {}
-        try:
-            with open(self.path, "r", encoding="utf-8", newline="") as handle:
-                reader = csv.DictReader(handle)
-                for row in reader:
-                    normalized = self._normalize_row(row)
-                    name = normalized.get("company name") or normalized.get("name") or ""
-                    symbol = normalized.get("symbol") or ""
-                    isin = normalized.get("isin") or ""
-                    if not name:
-                        continue
-                    name_norm = normalize_company_name(name).lower().strip()
-                    if not name_norm:
-                        name_norm = name.lower().strip()
-                    symbol_norm = symbol.lower().strip()
-                    raw_norm = name.lower().strip()
-
-                    if name_norm not in by_name:
-                        entry = {
-                            "name": name,
-                            "symbol": symbol,
-                            "isin": isin,
-                            "name_norm": name_norm,
-                            "symbol_norm": symbol_norm,
-                        }
-                        by_name[name_norm] = entry
-                        aliases_by_name[name_norm] = {name_norm, raw_norm}
-                    else:
-                        entry = by_name[name_norm]
-                        aliases_by_name[name_norm].add(raw_norm)
-                        aliases_by_name[name_norm].add(name_norm)
-
-                        # Prefer keeping a symbol/isin if the existing entry lacks it
-                        if not entry.get("symbol") and symbol:
-                            entry["symbol"] = symbol
-                            entry["symbol_norm"] = symbol_norm
-                        if not entry.get("isin") and isin:
-                            entry["isin"] = isin
-
-            # Build final entries list with aliases for matching
-            for name_norm, entry in by_name.items():
-                entry["aliases"] = tuple(aliases_by_name.get(name_norm, {name_norm}))
-                entries.append(entry)
-        except Exception as exc:
-            logger.exception("Failed to load BSE scrip list: %s", exc)
-            self._entries = []
-            self._mtime = None
-            return False
+        # A current sidecar skips both the CSV parse and the key sort
+        index = self._read_index(mtime)
+        if index is not None:
+            entries, prefix_keys = index
+        else:
+            try:
+                entries = self._read_csv()
+            except Exception as exc:
+                logger.exception("Failed to load BSE scrip list: %s", exc)
+                self._reset()
+                return False
+            prefix_keys = _build_prefix_keys(entries)
+            self._write_index(mtime, entries, prefix_keys)
 
-        entries.sort(key=lambda item: item["name_norm"])
-        self._entries = entries
+        self._suggest_cache.clear()
+        self._names = [entry["name"] for entry in entries]
+        self._symbols = [entry["symbol"] for entry in entries]
+        self._isins = [entry["isin"] for entry in entries]
+        self._labels = [
+            f"{name} ({symbol})" if symbol else name
+            for name, symbol in zip(self._names, self._symbols)
+        ]
+        # name_norm is already normalize_company_key(name)
+        self._fuzzy_candidates = [entry["name_norm"] for entry in entries]
+        # Typos rarely hit the first character, so fuzzy lookups only score
+        # names sharing the query's first letter
+        blocks: Dict[str, List[str]] = defaultdict(list)
+        for name_norm in self._fuzzy_candidates:
+            blocks[_block_key(name_norm)].append(name_norm)
+        self._fuzzy_blocks = dict(blocks)
+        (
+            self._name_keys,
+            self._name_key_indices,
+            self._symbol_keys,
+            self._symbol_key_indices,
+        ) = prefix_keys
         self._mtime = mtime
         return True
 
-    def suggest(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
-        if not query:
+    @property
+    def fuzzy_candidates(self) -> List[str]:
+        """
+        Normalized company names, in entry order, for fuzzy matching.
+
+        Names are normalized once at load, so they can be passed straight to
+        rapidfuzz with ``processor=None`` instead of being re-normalized on
+        every query.
+        """
+        self._load_if_needed()
+        return self._fuzzy_candidates
+
+    def fuzzy_match(self, query: str, threshold: int = 60) -> List[Tuple[str, int]]:
+        """
+        Fuzzy match a company name against the scrip list.
+
+        Only names starting with the same character as the normalized query
+        are scored; the full list is used if that block has no match.
+
+        Returns:
+            List of (normalized_name, score) tuples, sorted by score descending
+        """
+        candidates = self.fuzzy_candidates
+        if not candidates:
             return []
 
-        if not self._load_if_needed():
+        block = self._fuzzy_blocks.get(_block_key(normalize_company_key(query)))
+        if block:
+            matches = fuzzy_match_company(query, block, threshold)
+            if matches:
+                return matches
+        return fuzzy_match_company(query, candidates, threshold)
+
+    def suggest(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
+        if not query:
             return []
 
         normalized_query = query.strip().lower()
         if not normalized_query:
             return []
 
-        matches: List[Dict[str, str]] = []
-        seen_labels: set[str] = set()
-        for entry in self._entries:
-            aliases = entry.get("aliases", (entry["name_norm"],))
-            name_match = any(alias.startswith(normalized_query) for alias in aliases)
-            symbol_match = entry["symbol_norm"] and entry["symbol_norm"].startswith(normalized_query)
-            if name_match or symbol_match:
-                label = entry["name"]
-                if entry["symbol"]:
-                    label = f"{entry['name']} ({entry['symbol']})"
-                if label in seen_labels:
-                    continue
-                seen_labels.add(label)
-                matches.append({
-                    "name": entry["name"],
-                    "symbol": entry["symbol"],
-                    "isin": entry["isin"],
-                    "label": label,
-                })
-                if len(matches) >= limit:
-                    break
-
-        return matches
+        cache_key = (normalized_query, limit)
+        cached = self._suggest_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        if not self._load_if_needed():
+            return []
+
+        # Name and symbol hits are merged in rank (alphabetical) order; the
+        # set collapses an entry matched by several aliases or its symbol
+        name_lo, name_hi = _prefix_range(self._name_keys, normalized_query)
+        symbol_lo, symbol_hi = _prefix_range(self._symbol_keys, normalized_query)
+        hits = set(self._name_key_indices[name_lo:name_hi])
+        hits.update(self._symbol_key_indices[symbol_lo:symbol_hi])
+        indices = heapq.nsmallest(limit, hits)
+
+        # Indices are unique per entry, and entries are unique per name, so
+        # labels never repeat and no further dedupe is needed
+        matches = [
+            {
+                "name": self._names[index],
+                "symbol": self._symbols[index],
+                "isin": self._isins[index],
+                "label": self._labels[index],
+            }
+            for index in indices
+        ]
+
+        self._suggest_cache[cache_key] = matches
+        return list(matches)
+
+    async def suggest_async(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
+        """Run suggest() on the store's worker thread so a (re)load of the
+        scrip list never blocks the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.suggest, query, limit)
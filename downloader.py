@@ -2,100 +2,188 @@
 
 import os
 import asyncio
+import logging
 import aiohttp
-from typing import List, Tuple
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn
+from typing import Dict, List, Set, Tuple
+from uuid import uuid4
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 
 from config import config
 from utils import EarningsCall
 
 
+# Bytes read from the response per write, bounding memory per in-flight download
+CHUNK_SIZE = 64 * 1024
+
+
 class Downloader:
     """Handles downloading of earnings call documents."""
 
     def __init__(self):
-        self.timeout = aiohttp.ClientTimeout(total=config.request_timeout * 2)
+        # No total cap: large files may stream for a while, a stalled read may not
+        self.timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=config.request_timeout,
+            sock_read=config.request_timeout,
+        )
         self.headers = {
             "User-Agent": config.user_agent,
             "Accept": "*/*",
         }
+        self._logger = logging.getLogger(__name__)
+
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Create a session whose pooled connector reuses keep-alive
+        connections (and their TLS handshakes) across documents."""
+        connector = aiohttp.TCPConnector(
+            limit=config.max_concurrent_downloads * 4,
+            limit_per_host=config.max_concurrent_downloads,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers=self.headers,
+        )
 
     async def download_file(
         self,
         session: aiohttp.ClientSession,
         call: EarningsCall,
-        output_dir: str,
-        progress: Progress,
-        task_id: int
+        output_dir: str
     ) -> Tuple[bool, str]:
-        """Download a single file."""
-        filename = call.get_filename()
+        """Download a single file (existing files are skipped by download_all)."""
+        filename = call.filename
         filepath = os.path.join(output_dir, filename)
 
-        # Skip if already exists
-        if os.path.exists(filepath):
-            progress.update(task_id, description=f"[yellow]Skipped (exists): {filename}")
-            return True, filepath
-
         for attempt in range(config.max_retries):
             try:
-                async with session.get(call.url, headers=self.headers) as resp:
+                async with session.get(call.url) as resp:
                     if resp.status == 200:
-                        content = await resp.read()
-                        with open(filepath, "wb") as f:
-                            f.write(content)
-                        progress.update(task_id, description=f"[green]Downloaded: {filename}")
+                        await self._stream_to_file(resp, filepath)
                         return True, filepath
                     else:
                         if attempt == config.max_retries - 1:
-                            progress.update(task_id, description=f"[red]Failed ({resp.status}): {filename}")
+                            self._logger.warning("Failed (%s): %s", resp.status, filename)
                             return False, ""
 
             except Exception as e:
                 if attempt == config.max_retries - 1:
-                    progress.update(task_id, description=f"[red]Error: {filename} - {str(e)[:30]}")
+                    self._logger.warning("Error downloading %s: %s", filename, e)
                     return False, ""
                 await asyncio.sleep(config.retry_delay)
 
         return False, ""
 
+    async def _stream_to_file(self, resp: aiohttp.ClientResponse, filepath: str) -> None:
+        """Stream a response body to filepath via a .part file, so an
+        interrupted download never leaves a truncated file behind.
+
+        Each download gets its own uniquely named .part file: two calls that
+        map to the same filename must not interleave chunks in one file.
+        """
+        # Not mkstemp: its 0600 mode would carry over to the final file
+        part_path = f"{filepath}.{uuid4().hex}.part"
+        try:
+            with open(part_path, "xb") as f:
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    # Writes can block on a slow disk; keep them off the event loop
+                    await asyncio.to_thread(f.write, chunk)
+            os.replace(part_path, filepath)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+    @staticmethod
+    def group_by_output_dir(calls: List[EarningsCall]) -> Dict[str, List[EarningsCall]]:
+        """
+        Group documents by their company's output directory.
+
+        Args:
+            calls: Documents to download, possibly for several companies
+
+        Returns:
+            Output directory -> documents, in first-seen company order,
+            ready for download_all_grouped
+        """
+        # One get_output_path call (and makedirs) per company, not per document
+        dirs: Dict[str, str] = {}
+        groups: Dict[str, List[EarningsCall]] = {}
+        for call in calls:
+            output_dir = dirs.get(call.company)
+            if output_dir is None:
+                output_dir = dirs[call.company] = config.get_output_path(call.company)
+            groups.setdefault(output_dir, []).append(call)
+        return groups
+
     async def download_all(
         self,
         calls: List[EarningsCall],
         output_dir: str
     ) -> List[Tuple[EarningsCall, bool, str]]:
         """Download all earnings call documents."""
-        os.makedirs(output_dir, exist_ok=True)
-        results = []
+        return await self.download_all_grouped({output_dir: calls})
+
+    async def download_all_grouped(
+        self,
+        groups: Dict[str, List[EarningsCall]]
+    ) -> List[Tuple[EarningsCall, bool, str]]:
+        """
+        Download documents for several output directories in one session.
+
+        All groups share a connection pool, so documents on the same host
+        reuse connections across companies instead of re-handshaking per
+        directory.
+
+        Args:
+            groups: Output directory -> documents to save there
 
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+        Returns:
+            (call, success, path) tuples, in group then document order
+        """
+        jobs: List[Tuple[EarningsCall, str, Set[str]]] = []
+        for output_dir, calls in groups.items():
+            os.makedirs(output_dir, exist_ok=True)
+            # One directory listing instead of a stat per call to skip existing files
+            with os.scandir(output_dir) as it:
+                existing = {entry.name for entry in it}
+            jobs.extend((call, output_dir, existing) for call in calls)
+
+        # Caps open sockets and file handles however many calls are queued
+        semaphore = asyncio.BoundedSemaphore(config.max_concurrent_downloads)
+
+        async with self._make_session() as session:
+            # One aggregate bar: per-file tasks make Rich re-render a row per
+            # document on every update
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
+                MofNCompleteColumn(),
+                TextColumn("[dim]{task.fields[last]}"),
                 transient=False
             ) as progress:
-                tasks = []
-                task_map = {}
-                for call in calls:
-                    task_id = progress.add_task(f"Downloading {call.get_filename()}...", total=1)
-                    task = asyncio.create_task(
-                        self.download_file(session, call, output_dir, progress, task_id)
-                    )
-                    tasks.append(task)
-                    task_map[task] = (call, task_id)
-
-                for task in asyncio.as_completed(tasks):
-                    call, task_id = task_map[task]
-                    try:
-                        success, path = await task
-                    except Exception:
-                        success, path = False, ""
-                        progress.update(task_id, description=f"[red]Error: {call.get_filename()}")
-                    progress.update(task_id, completed=1)
-                    results.append((call, success, path))
-
-        return results
+                task_id = progress.add_task("Downloading", total=len(jobs), last="")
+
+                async def download_one(
+                    call: EarningsCall, output_dir: str, existing: Set[str]
+                ) -> Tuple[EarningsCall, bool, str]:
+                    if call.filename in existing:
+                        success, path = True, os.path.join(output_dir, call.filename)
+                    else:
+                        try:
+                            async with semaphore:
+                                success, path = await self.download_file(session, call, output_dir)
+                        except Exception as e:
+                            self._logger.warning("Error downloading %s: %s", call.filename, e)
+                            success, path = False, ""
+                    progress.update(task_id, advance=1, last=call.filename[:40])
+                    return call, success, path
+
+                results = await asyncio.gather(*(download_one(*job) for job in jobs))
+
+        return list(results)
 
     def download_sync(
         self,
@@ -104,3 +192,10 @@ class Downloader:
     ) -> List[Tuple[EarningsCall, bool, str]]:
         """Synchronous wrapper for download_all."""
         return asyncio.run(self.download_all(calls, output_dir))
+
+    def download_grouped_sync(
+        self,
+        groups: Dict[str, List[EarningsCall]]
+    ) -> List[Tuple[EarningsCall, bool, str]]:
+        """Synchronous wrapper for download_all_grouped."""
+        return asyncio.run(self.download_all_grouped(groups))
@@ -5,7 +5,8 @@ Interactive tool to download earnings documents for Indian companies.
 """
 
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -91,9 +92,8 @@ def search_and_download(
     console.print()
     console.print("[bold]Searching for earnings documents...[/bold]")
 
-    for company in companies:
-        console.print(f"\n[cyan]Searching:[/cyan] {company}")
-
+    def find_calls(company: str) -> Tuple[int, List[EarningsCall]]:
+        """Return (documents found on the IR site, all documents)."""
         # Try company IR website first
         calls = ir_source.get_earnings_calls(
             company,
@@ -103,30 +103,51 @@ def search_and_download(
             include_press_releases=include_press_releases
         )
 
+        ir_count = len(calls)
+
         # Fall back to Screener.in if not enough documents found
         if len(calls) < config.quarters_per_company:
-            if calls:
-                console.print(f"  [dim]Found {len(calls)} on IR site, checking Screener.in for more...[/dim]")
-            screener_calls = screener_source.get_earnings_calls(
+            calls.extend(screener_source.get_earnings_calls(
                 company,
                 count=config.quarters_per_company,
                 include_transcripts=include_transcripts,
                 include_presentations=include_presentations,
                 include_press_releases=include_press_releases
-            )
-            calls.extend(screener_calls)
+            ))
+        return ir_count, calls
+
+    # Lookups are network-bound, so companies are searched concurrently and
+    # each is reported as soon as its lookup finishes
+    found: List[List[EarningsCall]] = [[] for _ in companies]
+    with ThreadPoolExecutor(max_workers=min(8, len(companies))) as executor:
+        futures = {
+            executor.submit(find_calls, company): index
+            for index, company in enumerate(companies)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            ir_count, calls = future.result()
+            console.print(f"\n[cyan]Searched:[/cyan] {companies[index]}")
+            if 0 < ir_count < len(calls):
+                console.print(f"  [dim]Found {ir_count} on IR site, checked Screener.in for more[/dim]")
+            # Merge IR and Screener copies so the per-company count is accurate
+            calls = deduplicate_calls(calls)
+            if calls:
+                console.print(f"  [green]Found {len(calls)} document(s)[/green]")
+            else:
+                console.print(f"  [yellow]No documents found[/yellow]")
+            found[index] = calls
 
-        if calls:
-            console.print(f"  [green]Found {len(calls)} document(s)[/green]")
-            all_calls.extend(calls)
-        else:
-            console.print(f"  [yellow]No documents found[/yellow]")
+    # Combine in input order so the table and dedupe don't depend on timing
+    for calls in found:
+        all_calls.extend(calls)
 
     if not all_calls:
         console.print("\n[red]No documents found for any company.[/red]")
         return
 
-    # Deduplicate
+    # Deduplicate across companies: the same document can be reached through
+    # different URLs from two lookups, and source priority picks the copy
     all_calls = deduplicate_calls(all_calls)
 
     # Show what will be downloaded
@@ -154,12 +175,11 @@ def search_and_download(
 
     # Download
     console.print()
-    results = []
-    for company in set(c.company for c in all_calls):
-        company_calls = [c for c in all_calls if c.company == company]
-        output_dir = config.get_output_path(company)
+    # One session for every company so same-host downloads share connections
+    groups = downloader.group_by_output_dir(all_calls)
+    for output_dir in groups:
         console.print(f"[bold]Downloading to: {output_dir}[/bold]")
-        results.extend(downloader.download_sync(company_calls, output_dir))
+    results = downloader.download_grouped_sync(groups)
 
     # Summary
     success_count = sum(1 for _, success, _ in results if success)
@@ -1,8 +1,10 @@
 """Base class for earnings document sources."""
 
+import heapq
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from enum import Enum
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 
 
 class Region(Enum):
@@ -66,3 +68,33 @@ class BaseSource(ABC):
             List of EarningsCall objects
         """
         pass
+
+    @staticmethod
+    def _quarter_sort_key(quarter_key: Tuple[str, str]) -> Tuple[int, int]:
+        """
+        Sort key putting the newest (quarter, year) first.
+
+        The default handles calendar years ("2024"); sources with other year
+        or quarter labels override it.
+        """
+        quarter, year = quarter_key
+        q_num = int(quarter[1]) if quarter.startswith("Q") else 0
+        try:
+            y_num = int(year)
+        except ValueError:
+            y_num = 0
+        return (-y_num, -q_num)
+
+    def _limit_by_quarter(self, calls: List[Any], count: int) -> List[Any]:
+        """Limit results to the newest `count` quarters, ordered by _quarter_sort_key."""
+        by_quarter = defaultdict(list)
+        for call in calls:
+            by_quarter[(call.quarter, call.year)].append(call)
+
+        # Only the newest `count` quarters are kept, so select rather than sort
+        latest_quarters = heapq.nsmallest(count, by_quarter, key=self._quarter_sort_key)
+
+        result = []
+        for quarter_key in latest_quarters:
+            result.extend(by_quarter[quarter_key])
+        return result
@@ -4,12 +4,11 @@ import re
 import logging
 import requests
 from typing import List, Optional
-from collections import defaultdict
 from datetime import datetime
 
 from ..base import BaseSource, Region, FiscalYearType
 from ..registry import SourceRegistry
-from core.models import EarningsCall, normalize_company_name, find_best_company_match
+from core.models import EarningsCall, normalize_company_key, find_best_company_match
 from config import config
 
 
@@ -77,7 +76,7 @@ class CninfoSource(BaseSource):
 
     def _find_company(self, query: str) -> Optional[dict]:
         """Find company by name or stock code."""
-        normalized = normalize_company_name(query).lower()
+        normalized = normalize_company_key(query)
 
         # Direct match
         if normalized in self.KNOWN_COMPANIES:
@@ -213,31 +212,6 @@ class CninfoSource(BaseSource):
 
         return self._limit_by_quarter(calls, count)
 
-    def _limit_by_quarter(self, calls: List[EarningsCall], count: int) -> List[EarningsCall]:
-        """Limit results to specified number of quarters."""
-        by_quarter = defaultdict(list)
-
-        for call in calls:
-            quarter_key = (call.quarter, call.year)
-            by_quarter[quarter_key].append(call)
-
-        def quarter_sort_key(q):
-            quarter, year = q
-            q_num = int(quarter[1]) if quarter.startswith("Q") else 0
-            try:
-                y_num = int(year)
-            except ValueError:
-                y_num = 0
-            return (-y_num, -q_num)
-
-        sorted_quarters = sorted(by_quarter.keys(), key=quarter_sort_key)
-
-        result = []
-        for quarter_key in sorted_quarters[:count]:
-            result.extend(by_quarter[quarter_key])
-
-        return result
-
 
 # Auto-register when module is imported
 SourceRegistry.register(CninfoSource())
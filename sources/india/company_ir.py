@@ -6,14 +6,36 @@ import requests
 from bs4 import BeautifulSoup
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-from collections import defaultdict
 
 from ..base import BaseSource, Region, FiscalYearType
 from ..registry import SourceRegistry
-from core.models import EarningsCall, normalize_company_name, find_best_company_match
+from core.models import EarningsCall, normalize_company_key, find_best_company_match
 from config import config
 
 
+_QUARTER_YEAR_RE = re.compile(r'Q([1-4])\s*(?:FY)?[\'"]?(\d{2,4})', re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(
+    r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*[\s,.-]+(\d{4})',
+    re.IGNORECASE
+)
+
+# Month -> (quarter, offset added to the calendar year to get the FY).
+# Indian financial year: Apr-Mar
+_MONTH_TO_QUARTER = {
+    "jan": ("Q3", 0),
+    "feb": ("Q3", 0),
+    "mar": ("Q4", 0),
+    "apr": ("Q4", 0),
+    "may": ("Q1", 1),
+    "jun": ("Q1", 1),
+    "jul": ("Q1", 1),
+    "aug": ("Q2", 1),
+    "sep": ("Q2", 1),
+    "oct": ("Q2", 1),
+    "nov": ("Q3", 1),
+    "dec": ("Q3", 1),
+}
+
 # Known IR page mappings for major Indian companies
 KNOWN_IR_PAGES = {
     "reliance": "https://www.ril.com/investors/financial-reporting",
@@ -77,7 +99,7 @@ class CompanyIRSource(BaseSource):
 
     def _find_ir_page(self, company_name: str) -> Optional[str]:
         """Find the investor relations page URL for a company."""
-        normalized = normalize_company_name(company_name).lower()
+        normalized = normalize_company_key(company_name)
 
         # Direct/partial match
         for key, url in KNOWN_IR_PAGES.items():
@@ -93,38 +115,20 @@ class CompanyIRSource(BaseSource):
 
     def _extract_quarter_from_text(self, text: str) -> Tuple[str, str]:
         """Extract quarter and year from text."""
-        month_to_quarter = {
-            "jan": ("Q3", lambda y: f"FY{(int(y) % 100):02d}"),
-            "feb": ("Q3", lambda y: f"FY{(int(y) % 100):02d}"),
-            "mar": ("Q4", lambda y: f"FY{(int(y) % 100):02d}"),
-            "apr": ("Q4", lambda y: f"FY{(int(y) % 100):02d}"),
-            "may": ("Q1", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "jun": ("Q1", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "jul": ("Q1", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "aug": ("Q2", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "sep": ("Q2", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "oct": ("Q2", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "nov": ("Q3", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "dec": ("Q3", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-        }
-
-        q_match = re.search(r'Q([1-4])\s*(?:FY)?[\'"]?(\d{2,4})', text, re.IGNORECASE)
+        q_match = _QUARTER_YEAR_RE.search(text)
         if q_match:
             quarter = f"Q{q_match.group(1)}"
             year_str = q_match.group(2)
             year = f"FY{year_str}" if len(year_str) == 2 else f"FY{int(year_str) % 100:02d}"
             return quarter, year
 
-        month_match = re.search(
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*[\s,.-]+(\d{4})',
-            text, re.IGNORECASE
-        )
+        month_match = _MONTH_YEAR_RE.search(text)
         if month_match:
             month = month_match.group(1).lower()
             year = month_match.group(2)
-            if month in month_to_quarter:
-                quarter, fy_func = month_to_quarter[month]
-                return quarter, fy_func(year)
+            if month in _MONTH_TO_QUARTER:
+                quarter, fy_offset = _MONTH_TO_QUARTER[month]
+                return quarter, f"FY{(int(year) + fy_offset) % 100:02d}"
 
         return "", ""
 
@@ -148,7 +152,7 @@ class CompanyIRSource(BaseSource):
         try:
             resp = self.session.get(ir_url, timeout=config.request_timeout)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = BeautifulSoup(resp.content, "lxml")
             base_url = f"{urlparse(ir_url).scheme}://{urlparse(ir_url).netloc}"
 
             all_links = soup.find_all("a", href=True)
@@ -232,27 +236,13 @@ class CompanyIRSource(BaseSource):
 
         return self._limit_by_quarter(calls, count)
 
-    def _limit_by_quarter(self, calls: List[EarningsCall], count: int) -> List[EarningsCall]:
-        """Limit results to specified number of quarters."""
-        by_quarter = defaultdict(list)
-
-        for call in calls:
-            quarter_key = (call.quarter, call.year)
-            by_quarter[quarter_key].append(call)
-
-        def quarter_sort_key(q):
-            quarter, year = q
-            q_num = int(quarter[1]) if quarter.startswith("Q") else 0
-            y_num = int(year[2:]) if year.startswith("FY") and len(year) >= 4 else 0
-            return (-y_num, -q_num)
-
-        sorted_quarters = sorted(by_quarter.keys(), key=quarter_sort_key)
-
-        result = []
-        for quarter_key in sorted_quarters[:count]:
-            result.extend(by_quarter[quarter_key])
-
-        return result
+    @staticmethod
+    def _quarter_sort_key(quarter_key: Tuple[str, str]) -> Tuple[int, int]:
+        """Newest first, for Indian fiscal-year labels ("FY24")."""
+        quarter, year = quarter_key
+        q_num = int(quarter[1]) if quarter.startswith("Q") else 0
+        y_num = int(year[2:]) if year.startswith("FY") and len(year) >= 4 else 0
+        return (-y_num, -q_num)
 
 
 # Auto-register when module is imported
@@ -1,12 +1,13 @@
 """Screener.in data source for Indian company earnings documents."""
 
+import os
 import re
 import logging
-import requests
+import threading
+from requests_cache import CachedSession
 from bs4 import BeautifulSoup
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
-from collections import defaultdict
 
 from ..base import BaseSource, Region, FiscalYearType
 from ..registry import SourceRegistry
@@ -14,6 +15,34 @@ from core.models import EarningsCall, normalize_company_name
 from config import config
 
 
+_QUARTER_YEAR_RE = re.compile(r'Q([1-4])\s*(?:FY)?(\d{2,4})', re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(
+    r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+(\d{4})', re.IGNORECASE
+)
+_SECTION_ID_RE = re.compile(r"document|concall", re.IGNORECASE)
+_EXCHANGE_PDF_RE = re.compile(r"(bseindia|nseindia).*\.pdf", re.IGNORECASE)
+_TRANSCRIPT_RE = re.compile(r"transcript", re.IGNORECASE)
+_PRESENTATION_RE = re.compile(r"ppt|presentation", re.IGNORECASE)
+_CONCALL_LINK_RE = re.compile(r"transcript|ppt|presentation", re.IGNORECASE)
+
+# Month -> (quarter, offset added to the calendar year to get the FY).
+# Indian financial year: Apr-Mar
+_MONTH_TO_QUARTER = {
+    "jan": ("Q3", 0),
+    "feb": ("Q3", 0),
+    "mar": ("Q4", 0),
+    "apr": ("Q4", 0),
+    "may": ("Q1", 1),
+    "jun": ("Q1", 1),
+    "jul": ("Q1", 1),
+    "aug": ("Q2", 1),
+    "sep": ("Q2", 1),
+    "oct": ("Q2", 1),
+    "nov": ("Q3", 1),
+    "dec": ("Q3", 1),
+}
+
+
 class ScreenerSource(BaseSource):
     """Fetches earnings call data from Screener.in (any Indian company)."""
 
@@ -26,13 +55,36 @@ class ScreenerSource(BaseSource):
     SEARCH_URL = "https://www.screener.in/api/company/search/"
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Created on first request (see session), so registering the source
+        # at import never touches the cache directory
+        self._session: Optional[CachedSession] = None
+        self._session_lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def session(self) -> CachedSession:
+        """HTTP session backed by the on-disk cache, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @staticmethod
+    def _create_session() -> CachedSession:
+        # Company pages change a few times a quarter; repeat lookups within
+        # http_cache_ttl are served from the on-disk cache
+        session = CachedSession(
+            os.path.join(config.http_cache_dir, "screener"),
+            expire_after=config.http_cache_ttl,
+            allowable_codes=(200,),
+        )
+        session.headers.update({
             "User-Agent": config.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
         })
-        self._logger = logging.getLogger(__name__)
+        return session
 
     def search_company(self, query: str) -> Optional[dict]:
         """Search for company and return its info."""
@@ -83,7 +135,7 @@ class ScreenerSource(BaseSource):
         try:
             resp = self.session.get(company_url, timeout=config.request_timeout)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = BeautifulSoup(resp.content, "lxml")
 
             # Get actual company name from page
             name_elem = soup.select_one("h1.margin-0")
@@ -115,7 +167,7 @@ class ScreenerSource(BaseSource):
         if doc_section:
             return doc_section
 
-        doc_section = soup.find("section", {"id": re.compile(r"document|concall", re.I)})
+        doc_section = soup.find("section", {"id": _SECTION_ID_RE})
         if doc_section:
             return doc_section
 
@@ -124,7 +176,7 @@ class ScreenerSource(BaseSource):
             if any("concall" in c.lower() or "document" in c.lower() for c in classes):
                 return section
 
-        all_links = soup.find_all("a", href=re.compile(r"(bseindia|nseindia).*\.pdf", re.I))
+        all_links = soup.find_all("a", href=_EXCHANGE_PDF_RE)
         if all_links:
             return all_links[0].find_parent("section") or all_links[0].find_parent("div")
 
@@ -139,74 +191,63 @@ class ScreenerSource(BaseSource):
         include_press_releases: bool = True
     ) -> List[EarningsCall]:
         """Parse earnings call entries from section."""
-        calls = []
-        seen_urls = set()
-
-        # Month to quarter mapping (Indian financial year: Apr-Mar)
-        month_to_quarter = {
-            "jan": ("Q3", lambda y: f"FY{(int(y) % 100):02d}"),
-            "feb": ("Q3", lambda y: f"FY{(int(y) % 100):02d}"),
-            "mar": ("Q4", lambda y: f"FY{(int(y) % 100):02d}"),
-            "apr": ("Q4", lambda y: f"FY{(int(y) % 100):02d}"),
-            "may": ("Q1", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "jun": ("Q1", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "jul": ("Q1", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "aug": ("Q2", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "sep": ("Q2", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "oct": ("Q2", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "nov": ("Q3", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-            "dec": ("Q3", lambda y: f"FY{((int(y) + 1) % 100):02d}"),
-        }
+        # href -> call; dedupes links and keeps page order in one dict
+        calls_by_href: Dict[str, EarningsCall] = {}
 
         def extract_date_info(text: str) -> tuple[str, str]:
             """Extract quarter and fiscal year from text."""
-            q_match = re.search(r'Q([1-4])\s*(?:FY)?(\d{2,4})', text, re.IGNORECASE)
+            q_match = _QUARTER_YEAR_RE.search(text)
             if q_match:
                 quarter = f"Q{q_match.group(1)}"
                 year_str = q_match.group(2)
                 year = f"FY{year_str}" if len(year_str) == 2 else f"FY{int(year_str) % 100:02d}"
                 return quarter, year
 
-            month_match = re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+(\d{4})', text, re.IGNORECASE)
+            month_match = _MONTH_YEAR_RE.search(text)
             if month_match:
                 month = month_match.group(1).lower()
                 year = month_match.group(2)
-                if month in month_to_quarter:
-                    quarter, fy_func = month_to_quarter[month]
-                    return quarter, fy_func(year)
+                if month in _MONTH_TO_QUARTER:
+                    quarter, fy_offset = _MONTH_TO_QUARTER[month]
+                    return quarter, f"FY{(int(year) + fy_offset) % 100:02d}"
 
             return "", ""
 
         def add_call(href, context, doc_type):
-            if not href or href in seen_urls:
+            if not href or href in calls_by_href:
                 return
-            seen_urls.add(href)
             quarter, year = extract_date_info(context)
             if not quarter:
                 quarter, year = "Unknown", ""
-            full_url = href if href.startswith("http") else urljoin(self.BASE_URL, href)
-            calls.append(EarningsCall(
+            calls_by_href[href] = EarningsCall(
                 company=company_name,
                 quarter=quarter,
                 year=year,
                 doc_type=doc_type,
-                url=full_url,
+                url=urljoin(self.BASE_URL, href),  # no-op for absolute hrefs
                 source=self.source_name
-            ))
-
-        if include_transcripts:
-            transcript_links = section.find_all("a", string=re.compile(r"transcript", re.I))
-            for link in transcript_links:
-                parent_li = link.find_parent("li")
-                context = parent_li.get_text(" ", strip=True) if parent_li else ""
-                add_call(link.get("href", ""), context, "transcript")
+            )
 
-        if include_presentations:
-            ppt_links = section.find_all("a", string=re.compile(r"ppt|presentation", re.I))
-            for link in ppt_links:
+        if include_transcripts or include_presentations:
+            # One DOM pass for both types; transcript wins when a label matches both
+            li_text: dict[int, str] = {}
+            for link in section.find_all("a", string=_CONCALL_LINK_RE):
+                label = link.string
+                if include_transcripts and _TRANSCRIPT_RE.search(label):
+                    doc_type = "transcript"
+                elif include_presentations and _PRESENTATION_RE.search(label):
+                    doc_type = "presentation"
+                else:
+                    continue
                 parent_li = link.find_parent("li")
-                context = parent_li.get_text(" ", strip=True) if parent_li else ""
-                add_call(link.get("href", ""), context, "presentation")
+                if parent_li is None:
+                    context = ""
+                else:
+                    # Transcript and PPT links usually share an <li>
+                    context = li_text.get(id(parent_li))
+                    if context is None:
+                        context = li_text[id(parent_li)] = parent_li.get_text(" ", strip=True)
+                add_call(link.get("href", ""), context, doc_type)
 
         if include_press_releases:
             all_links = section.find_all("a", href=True)
@@ -243,29 +284,15 @@ class ScreenerSource(BaseSource):
                     context = parent.get_text(" ", strip=True) if parent else text
                     add_call(link.get("href", ""), context, "press_release")
 
-        return calls
-
-    def _limit_by_quarter(self, calls: List[EarningsCall], count: int) -> List[EarningsCall]:
-        """Limit results to specified number of quarters."""
-        by_quarter = defaultdict(list)
-
-        for call in calls:
-            quarter_key = (call.quarter, call.year)
-            by_quarter[quarter_key].append(call)
-
-        def quarter_sort_key(q):
-            quarter, year = q
-            q_num = int(quarter[1]) if quarter.startswith("Q") else 0
-            y_num = int(year[2:]) if year.startswith("FY") else 0
-            return (-y_num, -q_num)
-
-        sorted_quarters = sorted(by_quarter.keys(), key=quarter_sort_key)
-
-        result = []
-        for quarter_key in sorted_quarters[:count]:
-            result.extend(by_quarter[quarter_key])
+        return list(calls_by_href.values())
 
-        return result
+    @staticmethod
+    def _quarter_sort_key(quarter_key: Tuple[str, str]) -> Tuple[int, int]:
+        """Newest first, for Indian fiscal-year labels ("FY24")."""
+        quarter, year = quarter_key
+        q_num = int(quarter[1]) if quarter.startswith("Q") else 0
+        y_num = int(year[2:]) if year.startswith("FY") else 0
+        return (-y_num, -q_num)
 
 
 # Auto-register when module is imported
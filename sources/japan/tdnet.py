@@ -3,13 +3,12 @@
 import re
 import logging
 import requests
-from typing import List, Optional, Dict
-from collections import defaultdict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 
 from ..base import BaseSource, Region, FiscalYearType
 from ..registry import SourceRegistry
-from core.models import EarningsCall, normalize_company_name, fuzzy_match_company
+from core.models import EarningsCall, normalize_company_key, fuzzy_match_company
 from config import config
 
 
@@ -148,7 +147,7 @@ class TdnetSource(BaseSource):
         if not companies:
             return None
 
-        normalized = normalize_company_name(query).lower()
+        normalized = normalize_company_key(query)
 
         # Direct match by code or name
         if normalized in companies:
@@ -258,27 +257,13 @@ class TdnetSource(BaseSource):
 
         return self._limit_by_quarter(calls, count)
 
-    def _limit_by_quarter(self, calls: List[EarningsCall], count: int) -> List[EarningsCall]:
-        """Limit results to specified number of quarters."""
-        by_quarter = defaultdict(list)
-
-        for call in calls:
-            quarter_key = (call.quarter, call.year)
-            by_quarter[quarter_key].append(call)
-
-        def quarter_sort_key(q):
-            quarter, year = q
-            q_num = int(quarter[1]) if quarter.startswith("Q") else 5
-            y_num = int(year[2:]) if year.startswith("FY") else 0
-            return (-y_num, -q_num)
-
-        sorted_quarters = sorted(by_quarter.keys(), key=quarter_sort_key)
-
-        result = []
-        for quarter_key in sorted_quarters[:count]:
-            result.extend(by_quarter[quarter_key])
-
-        return result
+    @staticmethod
+    def _quarter_sort_key(quarter_key: Tuple[str, str]) -> Tuple[int, int]:
+        """Newest first, for Japanese fiscal-year labels; FY ranks as the latest period."""
+        quarter, year = quarter_key
+        q_num = int(quarter[1]) if quarter.startswith("Q") else 5
+        y_num = int(year[2:]) if year.startswith("FY") else 0
+        return (-y_num, -q_num)
 
 
 # Auto-register when module is imported
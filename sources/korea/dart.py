@@ -7,14 +7,17 @@ import zipfile
 import io
 import xml.etree.ElementTree as ET
 from typing import List, Optional, Dict
-from collections import defaultdict
 
 from ..base import BaseSource, Region, FiscalYearType
 from ..registry import SourceRegistry
-from core.models import EarningsCall, normalize_company_name, fuzzy_match_company
+from core.models import EarningsCall, normalize_company_key, fuzzy_match_company
 from config import config
 
 
+# Period suffix in report names, e.g. "분기보고서 (2024.09)"
+_REPORT_PERIOD_RE = re.compile(r'\((\d{4})\.(\d{2})\)')
+
+
 class DartSource(BaseSource):
     """
     Fetches earnings documents from DART (Data Analysis, Retrieval and Transfer System).
@@ -106,7 +109,7 @@ class DartSource(BaseSource):
         if not corp_codes:
             return None
 
-        normalized = normalize_company_name(query).lower()
+        normalized = normalize_company_key(query)
 
         # Direct match
         if normalized in corp_codes:
@@ -231,7 +234,7 @@ class DartSource(BaseSource):
     def _parse_report_info(self, report_nm: str, rcept_dt: str) -> tuple[str, str]:
         """Parse quarter and year from report name and date."""
         # Try to extract from report name (e.g., "분기보고서 (2024.09)")
-        match = re.search(r'\((\d{4})\.(\d{2})\)', report_nm)
+        match = _REPORT_PERIOD_RE.search(report_nm)
         if match:
             year = match.group(1)
             month = int(match.group(2))
@@ -261,31 +264,6 @@ class DartSource(BaseSource):
 
         return "", ""
 
-    def _limit_by_quarter(self, calls: List[EarningsCall], count: int) -> List[EarningsCall]:
-        """Limit results to specified number of quarters."""
-        by_quarter = defaultdict(list)
-
-        for call in calls:
-            quarter_key = (call.quarter, call.year)
-            by_quarter[quarter_key].append(call)
-
-        def quarter_sort_key(q):
-            quarter, year = q
-            q_num = int(quarter[1]) if quarter.startswith("Q") else 0
-            try:
-                y_num = int(year)
-            except ValueError:
-                y_num = 0
-            return (-y_num, -q_num)
-
-        sorted_quarters = sorted(by_quarter.keys(), key=quarter_sort_key)
-
-        result = []
-        for quarter_key in sorted_quarters[:count]:
-            result.extend(by_quarter[quarter_key])
-
-        return result
-
 
 # Auto-register when module is imported
 SourceRegistry.register(DartSource())
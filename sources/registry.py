@@ -8,19 +8,20 @@ class SourceRegistry:
     """Registry for regional sources."""
 
     _sources: Dict[Region, List[BaseSource]] = {}
+    _by_name: Dict[str, BaseSource] = {}
 
     @classmethod
     def register(cls, source: BaseSource) -> None:
         """Register a source for its region."""
-        if source.region not in cls._sources:
-            cls._sources[source.region] = []
+        # Avoid duplicate registrations (source names are unique across regions)
+        if source.source_name in cls._by_name:
+            return
+        cls._by_name[source.source_name] = source
 
-        # Avoid duplicate registrations
-        existing_names = [s.source_name for s in cls._sources[source.region]]
-        if source.source_name not in existing_names:
-            cls._sources[source.region].append(source)
-            # Sort by priority (lower = higher priority)
-            cls._sources[source.region].sort(key=lambda s: s.priority)
+        sources = cls._sources.setdefault(source.region, [])
+        sources.append(source)
+        # Sort by priority (lower = higher priority)
+        sources.sort(key=lambda s: s.priority)
 
     @classmethod
     def get_sources(cls, region: Region) -> List[BaseSource]:
@@ -43,13 +44,10 @@ class SourceRegistry:
     @classmethod
     def get_source_by_name(cls, name: str) -> Optional[BaseSource]:
         """Find a source by its name."""
-        for sources in cls._sources.values():
-            for source in sources:
-                if source.source_name == name:
-                    return source
-        return None
+        return cls._by_name.get(name)
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered sources (mainly for testing)."""
         cls._sources = {}
+        cls._by_name = {}
@@ -1,16 +1,57 @@
 """SEC EDGAR data source for US company earnings documents."""
 
+import os
 import re
+import sys
+import time
+import uuid
+import heapq
+import pickle
 import logging
-import requests
-from typing import List, Optional
-from collections import defaultdict
+import threading
+import orjson
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from requests_cache import DO_NOT_CACHE, CachedSession
+from urllib3.util.retry import Retry
 
 from ..base import BaseSource, Region, FiscalYearType
 from ..registry import SourceRegistry
-from core.models import EarningsCall, normalize_company_name, fuzzy_match_company
+from core.models import EarningsCall, normalize_company_key, fuzzy_match_company
 from config import config
 
+# Bump when the pickled ticker cache layout changes
+_TICKER_CACHE_VERSION = 2
+
+# Filing month -> (fiscal quarter reported, year offset); a filing covers the
+# previous calendar quarter, so Jan-Mar filings report last year's Q4
+_MONTH_TO_QUARTER = (
+    None,
+    ("Q4", -1), ("Q4", -1), ("Q4", -1),
+    ("Q1", 0), ("Q1", 0), ("Q1", 0),
+    ("Q2", 0), ("Q2", 0), ("Q2", 0),
+    ("Q3", 0), ("Q3", 0), ("Q3", 0),
+)
+
+# Keys sharing the most trigrams with a query that get fuzzy-scored
+FUZZY_CANDIDATES = 50
+
+
+class SecCompany(NamedTuple):
+    """One SEC registrant, shared by its name and ticker cache keys."""
+
+    cik: str
+    ticker: str
+    name: str
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
 
 class EdgarSource(BaseSource):
     """Fetches earnings documents from SEC EDGAR for US companies."""
@@ -26,52 +67,262 @@ class EdgarSource(BaseSource):
     SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
 
     def __init__(self):
-        self.session = requests.Session()
+        # Created on first request (see session), so registering the source
+        # at import never touches the cache directory
+        self._session: Optional[CachedSession] = None
+        self._session_lock = threading.Lock()
+        self._ticker_cache = None
+        # Serializes the first load, so concurrent lookups fetch the list once
+        self._ticker_load_lock = threading.Lock()
+        # Token index over ticker-cache keys, built alongside the cache
+        self._keys: List[str] = []
+        self._key_token_counts: List[int] = []
+        self._name_tokens: Dict[str, List[int]] = {}
+        self._trigram_index: Dict[str, List[int]] = {}
+        # Query -> resolved company; only valid for the current ticker cache
+        self._cik_lookups: LRUCache = LRUCache(maxsize=4096)
+        self._cik_lookups_lock = threading.Lock()
+        self._ticker_cache_path = os.path.join(config.http_cache_dir, "sec_tickers.pkl")
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def session(self) -> CachedSession:
+        """HTTP session backed by the on-disk cache, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @staticmethod
+    def _create_session() -> CachedSession:
+        # Submissions are kept on disk and revalidated with ETag /
+        # Last-Modified once stale, so unchanged filers cost a 304. The ticker
+        # list has its own pickle cache (see _read_ticker_cache).
+        session = CachedSession(
+            os.path.join(config.http_cache_dir, "edgar"),
+            expire_after=config.http_cache_ttl,
+            urls_expire_after={
+                "data.sec.gov/submissions": config.http_cache_ttl,
+                "*": DO_NOT_CACHE,
+            },
+            allowable_codes=(200,),
+        )
         # SEC requires User-Agent with company name and email
-        self.session.headers.update({
+        session.headers.update({
             "User-Agent": "EarningsDownloader/1.0 (earnings-downloader@example.com)",
             "Accept": "application/json",
             "Accept-Encoding": "gzip, deflate",
         })
-        self._ticker_cache = None
-        self._logger = logging.getLogger(__name__)
+        # Keep enough pooled connections for concurrent lookups, and back off
+        # on SEC rate limiting (429) and transient server errors
+        retry = Retry(
+            total=config.max_retries,
+            backoff_factor=config.retry_delay,
+            status_forcelist=(429, 500, 502, 503, 504),
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
+
+    def _read_ticker_cache(self) -> Optional[Dict[str, SecCompany]]:
+        """Ticker mapping from disk, if present and younger than the TTL."""
+        try:
+            if time.time() - os.path.getmtime(self._ticker_cache_path) > config.ticker_cache_ttl:
+                return None
+            with open(self._ticker_cache_path, "rb") as handle:
+                version, tickers = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.warning("Ignoring unreadable SEC ticker cache %s: %s", self._ticker_cache_path, e)
+            return None
+        if version != _TICKER_CACHE_VERSION:
+            return None
+        return tickers
+
+    def _write_ticker_cache(self, tickers: Dict[str, SecCompany]) -> None:
+        """Persist the ticker mapping; an unwritable cache dir just skips this."""
+        # Unique per writer: other threads and processes may be writing too
+        tmp_path = f"{self._ticker_cache_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._ticker_cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as handle:
+                pickle.dump((_TICKER_CACHE_VERSION, tickers), handle, protocol=5)
+            os.replace(tmp_path, self._ticker_cache_path)
+        except OSError as e:
+            self._logger.debug("Could not write SEC ticker cache %s: %s", self._ticker_cache_path, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
-    def _load_ticker_data(self) -> dict:
+    def _load_ticker_data(self) -> Dict[str, SecCompany]:
         """Load SEC company tickers mapping."""
-        if self._ticker_cache is None:
-            try:
-                resp = self.session.get(self.COMPANY_TICKERS_URL, timeout=config.request_timeout)
-                resp.raise_for_status()
-                data = resp.json()
-                # Build lookup by company name (normalized) and ticker
-                self._ticker_cache = {}
-                for _, info in data.items():
-                    name = info.get("title", "").lower()
-                    ticker = info.get("ticker", "").upper()
-                    cik = str(info.get("cik_str", "")).zfill(10)
-                    self._ticker_cache[name] = {"cik": cik, "ticker": ticker, "name": info.get("title", "")}
-                    self._ticker_cache[ticker.lower()] = {"cik": cik, "ticker": ticker, "name": info.get("title", "")}
-            except Exception as e:
-                self._logger.warning("Error loading SEC ticker data: %s", e)
-                self._ticker_cache = {}
-        return self._ticker_cache
-
-    def _find_company_cik(self, company_name: str) -> Optional[dict]:
+        tickers = self._ticker_cache
+        if tickers is not None:
+            return tickers
+        with self._ticker_load_lock:
+            # Another thread may have finished the load while we waited
+            if self._ticker_cache is not None:
+                return self._ticker_cache
+            tickers = self._read_ticker_cache()
+            if tickers is None:
+                try:
+                    resp = self.session.get(self.COMPANY_TICKERS_URL, timeout=config.request_timeout)
+                    resp.raise_for_status()
+                    # orjson parses straight from the response bytes, skipping
+                    # the decode-to-str copy resp.json() makes
+                    data = orjson.loads(resp.content)
+                    tickers = self._build_ticker_cache(data)
+                    self._write_ticker_cache(tickers)
+                except Exception as e:
+                    self._logger.warning("Error loading SEC ticker data: %s", e)
+                    tickers = {}
+            self._build_name_index(tickers)
+            return tickers
+
+    @staticmethod
+    def _build_ticker_cache(data: dict) -> Dict[str, SecCompany]:
+        """Lookup by lowercased company name and ticker, one record per company."""
+        tickers = {}
+        intern = sys.intern
+        for info in data.values():
+            title = info.get("title", "")
+            ticker = info.get("ticker", "").upper()
+            company = SecCompany(intern(str(info.get("cik_str", "")).zfill(10)), ticker, title)
+            tickers[title.lower()] = company
+            tickers[ticker.lower()] = company
+        return tickers
+
+    def _build_name_index(self, tickers: Dict[str, SecCompany]) -> None:
+        """
+        Index every ticker-cache key by its whitespace tokens, then install
+        tickers as the ticker cache.
+
+        The index is built in locals and published last, ticker cache after
+        the index, so a lookup that sees the cache never sees a partial index.
+        """
+        keys = list(tickers)
+        key_token_counts = []
+        name_tokens = defaultdict(list)
+        trigram_index = defaultdict(list)
+        for position, key in enumerate(keys):
+            tokens = set(key.split())
+            key_token_counts.append(len(tokens))
+            for token in tokens:
+                name_tokens[token].append(position)
+            for trigram in _trigrams(key):
+                trigram_index[trigram].append(position)
+
+        self._keys = keys
+        self._key_token_counts = key_token_counts
+        self._name_tokens = dict(name_tokens)
+        self._trigram_index = dict(trigram_index)
+        with self._cik_lookups_lock:
+            self._cik_lookups.clear()
+        self._ticker_cache = tickers
+
+    def _fuzzy_candidates(self, normalized: str) -> List[str]:
+        """
+        Keys sharing the most trigrams with the query, in SEC order.
+
+        Ties at the cut-off go to the earlier key, so the candidates don't
+        depend on set iteration order (which varies with PYTHONHASHSEED).
+        """
+        query_trigrams = _trigrams(normalized)
+        if not query_trigrams:
+            # Too short to prefilter
+            return self._keys
+        counts = Counter()
+        for trigram in query_trigrams:
+            counts.update(self._trigram_index.get(trigram, ()))
+        top = heapq.nsmallest(
+            FUZZY_CANDIDATES, counts.items(), key=lambda item: (-item[1], item[0])
+        )
+        positions = sorted(position for position, _ in top)
+        return [self._keys[position] for position in positions]
+
+    def _match_tokens(self, normalized: str) -> Optional[str]:
+        """
+        Best key sharing whole tokens with the query.
+
+        Prefers keys containing every query token, then keys whose tokens all
+        appear in the query. Ties go to the earliest key, i.e. SEC's own order.
+        """
+        postings = [self._name_tokens.get(token) for token in set(normalized.split())]
+        if not postings:
+            return None
+
+        # Query contained in key
+        if all(postings):
+            postings.sort(key=len)
+            hits = set(postings[0]).intersection(*postings[1:])
+            if hits:
+                return self._keys[min(hits)]
+
+        # Key contained in query
+        counts = Counter()
+        for posting in postings:
+            if posting:
+                counts.update(posting)
+        contained = [
+            position for position, count in counts.items()
+            if count == self._key_token_counts[position]
+        ]
+        if contained:
+            return self._keys[min(contained)]
+        return None
+
+    def _find_company_cik(self, company_name: str) -> Optional[SecCompany]:
         """Find company CIK number from name or ticker."""
         tickers = self._load_ticker_data()
-        normalized = normalize_company_name(company_name).lower()
+        with self._cik_lookups_lock:
+            if company_name in self._cik_lookups:
+                return self._cik_lookups[company_name]
+
+        company_info = self._lookup_company_cik(tickers, company_name)
+        with self._cik_lookups_lock:
+            self._cik_lookups[company_name] = company_info
+        return company_info
+
+    def find_companies(self, company_names: List[str]) -> List[Optional[SecCompany]]:
+        """Resolve many company names or tickers in parallel, in input order."""
+        # Load the ticker cache once up front so workers don't all fetch it
+        self._load_ticker_data()
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self._find_company_cik, company_names))
+
+    def _lookup_company_cik(
+        self, tickers: Dict[str, SecCompany], company_name: str
+    ) -> Optional[SecCompany]:
+        """Uncached body of _find_company_cik."""
+        query = company_name.strip()
+
+        # Short single words normalize to themselves, so a ticker hit can skip
+        # normalization entirely
+        if len(query) <= 6 and query.isalnum():
+            company = tickers.get(query.lower())
+            if company is not None:
+                return company
+
+        normalized = normalize_company_key(company_name)
 
         # Direct match
         if normalized in tickers:
             return tickers[normalized]
 
-        # Partial match on company name
-        for key, info in tickers.items():
-            if normalized in key or key in normalized:
-                return info
+        # Ticker-style queries ("AAPL") only ever match the ticker map
+        is_ticker = len(query) <= 6 and query.isalnum() and query.isupper()
+
+        # Partial match on company name tokens
+        if not is_ticker:
+            key = self._match_tokens(normalized)
+            if key is not None:
+                return tickers[key]
 
         # Fuzzy match
-        candidates = list(tickers.keys())
+        candidates = self._fuzzy_candidates(normalized)
         matches = fuzzy_match_company(company_name, candidates, threshold=70)
         if matches:
             best_match = matches[0][0]
@@ -84,10 +335,10 @@ class EdgarSource(BaseSource):
         company_info = self._find_company_cik(query)
         if company_info:
             return {
-                "name": company_info["name"],
-                "ticker": company_info["ticker"],
-                "cik": company_info["cik"],
-                "url": f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={company_info['cik']}&type=10-&dateb=&owner=include&count=40",
+                "name": company_info.name,
+                "ticker": company_info.ticker,
+                "cik": company_info.cik,
+                "url": f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={company_info.cik}&type=10-&dateb=&owner=include&count=40",
                 "source": self.source_name,
                 "region": self.region.value
             }
@@ -118,15 +369,16 @@ class EdgarSource(BaseSource):
             self._logger.info("Company not found in SEC database: %s", company_name)
             return calls
 
-        cik = company_info["cik"]
-        actual_name = company_info["name"]
+        actual_name = company_info.name
+        # Archive paths use the CIK without its zero padding
+        url_prefix = f"https://www.sec.gov/Archives/edgar/data/{company_info.cik.lstrip('0')}/"
 
         try:
             # Fetch company submissions
-            submissions_url = self.SUBMISSIONS_URL.format(cik=cik)
+            submissions_url = self.SUBMISSIONS_URL.format(cik=company_info.cik)
             resp = self.session.get(submissions_url, timeout=config.request_timeout)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             filings = data.get("filings", {}).get("recent", {})
 
@@ -141,19 +393,21 @@ class EdgarSource(BaseSource):
                 "10-K": "presentation",    # Annual report (treated as presentation)
                 "8-K": "press_release",    # Current report (press releases)
             }
+            included_types = {
+                "transcript": include_transcripts,
+                "presentation": include_presentations,
+                "press_release": include_press_releases,
+            }
+            wanted_forms = {
+                form: doc_type for form, doc_type in relevant_forms.items()
+                if included_types[doc_type]
+            }
 
+            # Recent filings run to ~1000 rows, mostly irrelevant forms; one
+            # dict probe rejects each of those
             for i, form in enumerate(forms):
-                if form not in relevant_forms:
-                    continue
-
-                doc_type = relevant_forms[form]
-
-                # Check if we should include this type
-                if doc_type == "transcript" and not include_transcripts:
-                    continue
-                if doc_type == "presentation" and not include_presentations:
-                    continue
-                if doc_type == "press_release" and not include_press_releases:
+                doc_type = wanted_forms.get(form)
+                if doc_type is None:
                     continue
 
                 # Parse date to quarter
@@ -168,7 +422,7 @@ class EdgarSource(BaseSource):
                 primary_doc = primary_docs[i] if i < len(primary_docs) else ""
 
                 if accession and primary_doc:
-                    doc_url = f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accession}/{primary_doc}"
+                    doc_url = url_prefix + accession + "/" + primary_doc
 
                     calls.append(EarningsCall(
                         company=actual_name,
@@ -199,54 +453,30 @@ class EdgarSource(BaseSource):
 
         try:
             # Date format: YYYY-MM-DD
-            parts = date_str.split("-")
-            year = parts[0]
-            month = int(parts[1])
-
-            # For 10-K, the filing is typically for the previous year
-            if form == "10-K":
-                return "FY", year
-
-            # For 10-Q and 8-K, map to quarters
-            if month in [1, 2, 3]:
-                quarter = "Q4"  # Filing is for previous quarter
-                year = str(int(year) - 1)
-            elif month in [4, 5, 6]:
-                quarter = "Q1"
-            elif month in [7, 8, 9]:
-                quarter = "Q2"
-            else:
-                quarter = "Q3"
-
-            return quarter, year
-
-        except Exception:
+            year, month, _ = date_str.split("-", 2)
+            quarter, year_offset = _MONTH_TO_QUARTER[int(month)]
+        except (ValueError, IndexError, TypeError):
             return "", ""
 
-    def _limit_by_quarter(self, calls: List[EarningsCall], count: int) -> List[EarningsCall]:
-        """Limit results to specified number of quarters."""
-        by_quarter = defaultdict(list)
+        # For 10-K, the filing is typically for the previous year
+        if form == "10-K":
+            return "FY", year
 
-        for call in calls:
-            quarter_key = (call.quarter, call.year)
-            by_quarter[quarter_key].append(call)
+        # For 10-Q and 8-K, map to quarters
+        if year_offset:
+            year = str(int(year) + year_offset)
+        return quarter, year
 
-        def quarter_sort_key(q):
-            quarter, year = q
-            try:
-                y_num = int(year)
-            except ValueError:
-                y_num = 0
-            q_num = int(quarter[1]) if quarter.startswith("Q") else 5  # FY comes last
-            return (-y_num, -q_num)
-
-        sorted_quarters = sorted(by_quarter.keys(), key=quarter_sort_key)
-
-        result = []
-        for quarter_key in sorted_quarters[:count]:
-            result.extend(by_quarter[quarter_key])
-
-        return result
+    @staticmethod
+    def _quarter_sort_key(quarter_key: Tuple[str, str]) -> Tuple[int, int]:
+        """Newest first; a year's annual (FY) filing ranks as its latest period."""
+        quarter, year = quarter_key
+        try:
+            y_num = int(year)
+        except ValueError:
+            y_num = 0
+        q_num = int(quarter[1]) if quarter.startswith("Q") else 5  # FY comes last
+        return (-y_num, -q_num)
 
 
 # Auto-register when module is imported
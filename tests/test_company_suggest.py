@@ -1,12 +1,15 @@
 import csv
 import os
 import tempfile
+import time
 import unittest
+from unittest import mock
 
 from fastapi.testclient import TestClient
 
 from api.app import app
-from api.routes import companies as companies_module
+from api.dependencies import get_bse_scrip_store
+from core.storage import bse_scrip
 from core.storage.bse_scrip import BseScripStore
 
 
@@ -19,11 +22,15 @@ class TestCompanySuggest(unittest.TestCase):
         writer.writerow(["Aegis Logistics Ltd.", "AEGISLOG", "INE208C01025"])
         self.temp_file.close()
 
-        companies_module.BSE_SCRIP_STORE = BseScripStore(self.temp_file.name)
+        store = BseScripStore(self.temp_file.name)
+        app.dependency_overrides[get_bse_scrip_store] = lambda: store
         self.client = TestClient(app)
 
     def tearDown(self):
-        os.unlink(self.temp_file.name)
+        app.dependency_overrides.pop(get_bse_scrip_store, None)
+        for path in (self.temp_file.name, self.temp_file.name + ".idx.pkl"):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_suggest_prefix(self):
         response = self.client.get("/api/companies/suggest", params={"q": "AB", "region": "india"})
@@ -39,6 +46,57 @@ class TestCompanySuggest(unittest.TestCase):
         labels = [item["label"] for item in data]
         self.assertIn("Aegis Logistics Ltd. (AEGISLOG)", labels)
 
+    def test_suggest_full_name_alias(self):
+        response = self.client.get("/api/companies/suggest", params={"q": "abb ltd", "region": "india"})
+        self.assertEqual(response.status_code, 200)
+        labels = [item["label"] for item in response.json()]
+        self.assertEqual(labels, ["ABB Ltd. (ABB)"])
+
+    def test_suggest_no_match(self):
+        response = self.client.get("/api/companies/suggest", params={"q": "zz", "region": "india"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+    def test_store_fuzzy_match(self):
+        store = BseScripStore(self.temp_file.name)
+        matches = store.fuzzy_match("Aegis Logistic")
+        self.assertEqual(matches[0][0], "aegis logistics")
+        self.assertEqual(store.fuzzy_match("qqqq zzzz"), [])
+
+    def test_store_reuses_persisted_index(self):
+        self.assertTrue(BseScripStore(self.temp_file.name).suggest("ab"))
+        self.assertTrue(os.path.exists(self.temp_file.name + ".idx.pkl"))
+
+        store = BseScripStore(self.temp_file.name)
+        with mock.patch.object(store, "_read_csv", side_effect=AssertionError("parsed CSV")), \
+                mock.patch.object(bse_scrip, "_build_prefix_keys", side_effect=AssertionError("sorted keys")):
+            labels = [item["label"] for item in store.suggest("ab")]
+        self.assertEqual(labels, ["ABB Ltd. (ABB)"])
+
+    def test_store_ignores_stale_index(self):
+        BseScripStore(self.temp_file.name).suggest("ab")
+        with open(self.temp_file.name, "a", newline="") as handle:
+            csv.writer(handle).writerow(["Abbott India Ltd.", "ABBOTINDIA", "INE358A01014"])
+        stat = os.stat(self.temp_file.name)
+        os.utime(self.temp_file.name, (stat.st_atime, stat.st_mtime + 10))
+
+        labels = [item["label"] for item in BseScripStore(self.temp_file.name).suggest("ab")]
+        self.assertIn("Abbott India Ltd. (ABBOTINDIA)", labels)
+
+    def test_store_loads_large_list_quickly(self):
+        # Several thousand scrips must load well within one autocomplete request
+        with open(self.temp_file.name, "w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["Company name", "symbol", "ISIN"])
+            for i in range(6000):
+                writer.writerow([f"Company {i:05d} Industries Ltd.", f"CO{i:05d}", f"INE{i:06d}01"])
+
+        store = BseScripStore(self.temp_file.name)
+        started = time.perf_counter()
+        self.assertTrue(store._load_if_needed())
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(len(store.suggest("company 0012", limit=50)), 10)
+
 
 if __name__ == "__main__":
     unittest.main()
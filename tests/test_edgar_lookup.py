@@ -0,0 +1,108 @@
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import orjson
+
+from config import config
+from sources.us import edgar
+from sources.us.edgar import EdgarSource
+
+
+# Shape of SEC company_tickers.json, in SEC's own ranking order
+TICKERS = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 789019, "ticker": "MSFT", "title": "Microsoft Corp"},
+    "2": {"cik_str": 1652044, "ticker": "GOOGL", "title": "Alphabet Inc."},
+    "3": {"cik_str": 1090872, "ticker": "A", "title": "Agilent Technologies Inc."},
+    "4": {"cik_str": 1018724, "ticker": "AMZN", "title": "Amazon Com Inc"},
+}
+
+
+class _Response:
+    content = orjson.dumps(TICKERS)
+
+    def raise_for_status(self):
+        pass
+
+
+class TestEdgarLookup(unittest.TestCase):
+    def setUp(self):
+        # The session's SQLite cache is created on first use; keep it out of ./data
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.object(config, "http_cache_dir", cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.source = EdgarSource()
+        # Keep the test offline and away from the shared on-disk cache
+        self.source._read_ticker_cache = lambda: None
+        self.source._write_ticker_cache = lambda tickers: None
+        self.source.session.get = lambda url, timeout=None: _Response()
+
+    def test_ticker_lookup(self):
+        self.assertEqual(self.source._find_company_cik("MSFT").name, "Microsoft Corp")
+        self.assertEqual(self.source._find_company_cik("A").cik, "0001090872")
+
+    def test_partial_name_lookup(self):
+        self.assertEqual(self.source._find_company_cik("Apple").ticker, "AAPL")
+        self.assertEqual(self.source._find_company_cik("agilent technologies").ticker, "A")
+
+    def test_query_containing_name(self):
+        self.assertEqual(self.source._find_company_cik("microsoft corp earnings").ticker, "MSFT")
+
+    def test_fuzzy_fallback(self):
+        self.assertEqual(self.source._find_company_cik("Alphabett").ticker, "GOOGL")
+
+    def test_lookups_are_memoized(self):
+        first = self.source._find_company_cik("Alphabett")
+        self.source._lookup_company_cik = None  # any further lookup would fail
+        self.assertIs(self.source._find_company_cik("Alphabett"), first)
+
+    def test_find_companies_keeps_input_order(self):
+        found = self.source.find_companies(["AMZN", "Apple", "Nonexistent Widgets Xyz"])
+        self.assertEqual(found[0].ticker, "AMZN")
+        self.assertEqual(found[1].ticker, "AAPL")
+        self.assertIsNone(found[2])
+
+    def test_concurrent_first_lookups_download_once(self):
+        downloads = []
+
+        def slow_get(url, timeout=None):
+            downloads.append(url)
+            time.sleep(0.05)
+            return _Response()
+
+        self.source.session.get = slow_get
+        threads = [
+            threading.Thread(target=self.source._find_company_cik, args=(name,))
+            for name in ("AAPL", "MSFT", "Apple", "Amazon") * 5
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(downloads), 1)
+        self.assertEqual(self.source._find_company_cik("AMZN").name, "Amazon Com Inc")
+
+    def test_fuzzy_candidates_ignore_trigram_order(self):
+        # Both groups share three trigrams with the query, and each group alone
+        # fills the cut-off, so which group wins is decided by the tie-break
+        size = edgar.FUZZY_CANDIDATES
+        names = [f"x zeta {i:03d}" for i in range(size)] + [f"acme {i:03d}" for i in range(size)]
+        self.source._build_name_index({name: None for name in names})
+        query = "acme zeta"
+        trigrams = sorted(edgar._trigrams(query))
+
+        # Every rotation, so each group's trigrams get counted first at least once
+        for start in range(len(trigrams)):
+            ordered = trigrams[start:] + trigrams[:start]
+            with mock.patch.object(edgar, "_trigrams", lambda text, ordered=ordered: ordered):
+                self.assertEqual(self.source._fuzzy_candidates(query), names[:size])
+
+
+if __name__ == "__main__":
+    unittest.main()
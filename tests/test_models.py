@@ -0,0 +1,88 @@
+import unittest
+
+from core.models import (
+    EarningsCall, batch_best_matches, normalize_company_key, normalize_company_name,
+    parse_quarter_year,
+)
+
+
+class TestNormalizeCompanyName(unittest.TestCase):
+    def test_strips_legal_suffix(self):
+        self.assertEqual(normalize_company_name("Tata Motors Ltd."), "Tata Motors")
+        self.assertEqual(normalize_company_name("Microsoft Corporation"), "Microsoft")
+        self.assertEqual(normalize_company_name("Siemens AG"), "Siemens")
+
+    def test_strips_stacked_suffixes(self):
+        self.assertEqual(normalize_company_name("ABC Co Ltd"), "ABC")
+        self.assertEqual(normalize_company_name("Bajaj Holdings Ltd"), "Bajaj")
+        self.assertEqual(normalize_company_name("ABC Ltd Group"), "ABC")
+
+    def test_suffix_is_case_insensitive(self):
+        self.assertEqual(normalize_company_name("hdfc bank limited"), "hdfc bank")
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(normalize_company_name("  Foo   Bar  Limited "), "Foo Bar")
+
+    def test_keeps_bare_suffix_word(self):
+        self.assertEqual(normalize_company_name("Group"), "Group")
+        self.assertEqual(normalize_company_name("Coforge"), "Coforge")
+
+
+class TestNormalizeCompanyKey(unittest.TestCase):
+    def test_lowercases_normalized_name(self):
+        self.assertEqual(normalize_company_key("  HDFC  Bank Limited "), "hdfc bank")
+
+    def test_equal_keys_are_interned(self):
+        first = normalize_company_key("Tata Motors Ltd.")
+        second = normalize_company_key("TATA MOTORS")
+        self.assertIs(first, second)
+
+
+class TestBatchBestMatches(unittest.TestCase):
+    def test_matches_each_query(self):
+        candidates = ["tata motors", "infosys", "reliance industries"]
+        matches = batch_best_matches(["Infosys Ltd", "Tata Motor", "qqqq zzzz"], candidates)
+        self.assertEqual(matches, ["infosys", "tata motors", None])
+
+    def test_empty_candidates(self):
+        self.assertEqual(batch_best_matches(["Infosys"], []), [None])
+
+
+class TestParseQuarterYear(unittest.TestCase):
+    def test_fiscal_year_suffix(self):
+        self.assertEqual(parse_quarter_year("Concall Q3FY26"), ("Q3", "FY26"))
+
+    def test_calendar_year_case_insensitive(self):
+        self.assertEqual(parse_quarter_year("q2 2025 results"), ("Q2", "2025"))
+
+    def test_no_match(self):
+        self.assertEqual(parse_quarter_year("Annual Report"), (None, None))
+
+
+class TestEarningsCallFilename(unittest.TestCase):
+    def _call(self, url: str, company: str = "Tata Motors Ltd.") -> EarningsCall:
+        return EarningsCall(
+            company=company, quarter="Q3", year="FY26",
+            doc_type="presentation", url=url, source="screener"
+        )
+
+    def test_extension_from_url_path(self):
+        self.assertEqual(
+            self._call("https://x.com/files/Deck.PPTX?v=2").get_filename(),
+            "Tata_Motors_Ltd_Q3FY26_presentation.pptx"
+        )
+        self.assertTrue(self._call("https://x.com/a/b.pdf").get_filename().endswith(".pdf"))
+
+    def test_unknown_extension_defaults_to_pdf(self):
+        self.assertTrue(self._call("https://x.com/AnnPdfOpen.aspx?Pname=a").get_filename().endswith(".pdf"))
+
+    def test_cached_filename_does_not_affect_equality(self):
+        first = self._call("https://x.com/a/b.pdf")
+        second = self._call("https://x.com/a/b.pdf")
+        self.assertEqual(first.filename, first.get_filename())
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from sources.india.screener import ScreenerSource
+
+
+PAGE = """
+<html><body>
+<h1 class="margin-0">Acme Industries Ltd</h1>
+<section id="documents">
+  <ul>
+    <li>Nov 2025 <a href="https://www.bseindia.com/a/t1.pdf">Transcript</a>
+        <a href="https://www.bseindia.com/a/p1.pdf">PPT</a></li>
+    <li>Q4FY25 <a href="https://www.bseindia.com/a/t2.pdf">Transcript</a></li>
+    <li>Feb 2025 <a href="/docs/t3.pdf">Transcript</a>
+        <a href="https://www.bseindia.com/a/t3.pdf">Transcript</a></li>
+    <li>May 2025 <a href="https://www.bseindia.com/a/pr1.pdf">Press Release</a></li>
+  </ul>
+</section>
+</body></html>
+"""
+
+
+class TestScreenerParse(unittest.TestCase):
+    def setUp(self):
+        self.source = ScreenerSource()
+        self.soup = BeautifulSoup(PAGE, "lxml")
+
+    def _parse(self, **kwargs):
+        section = self.source._find_concall_section(self.soup)
+        return self.source._parse_concall_entries(section, "Acme Industries Ltd", **kwargs)
+
+    def test_quarters_from_month_and_quarter_labels(self):
+        calls = self._parse(include_presentations=False, include_press_releases=False)
+        self.assertEqual(
+            [(c.quarter, c.year, c.url) for c in calls],
+            [
+                ("Q3", "FY26", "https://www.bseindia.com/a/t1.pdf"),
+                ("Q4", "FY25", "https://www.bseindia.com/a/t2.pdf"),
+                ("Q3", "FY25", "https://www.screener.in/docs/t3.pdf"),
+                ("Q3", "FY25", "https://www.bseindia.com/a/t3.pdf"),
+            ],
+        )
+
+    def test_doc_types_and_duplicate_links(self):
+        calls = self._parse()
+        by_type = {}
+        for call in calls:
+            by_type.setdefault(call.doc_type, []).append(call.url)
+        self.assertEqual(by_type["presentation"], ["https://www.bseindia.com/a/p1.pdf"])
+        self.assertEqual(by_type["press_release"], ["https://www.bseindia.com/a/pr1.pdf"])
+        self.assertEqual(len({call.url for call in calls}), len(calls))
+
+    def test_limit_by_quarter_keeps_latest(self):
+        calls = self._parse(include_presentations=False, include_press_releases=False)
+        limited = self.source._limit_by_quarter(calls, 2)
+        self.assertEqual(
+            [(c.quarter, c.year) for c in limited],
+            [("Q3", "FY26"), ("Q4", "FY25")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()